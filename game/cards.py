@@ -8,11 +8,18 @@ Loads all 44 card definitions from cards.yaml:
 
 from __future__ import annotations
 
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from .models import (
     Card,
     CardType,
@@ -27,18 +34,42 @@ from .models import (
 _CARDS_YAML = Path(__file__).parent / "cards.yaml"
 
 # Cleanup action types in the order they appear in the compact [a, b, c, d, e] list
-_CLEANUP_KEYS = [
+_CLEANUP_KEYS = (
     "get_kimchi",
     "move_distance",
     "move_waitress",
     "inventory_drop",
     "move_recruit_train",
-]
+)
+
+# Used when a card has no "cleanup" entry
+_DEFAULT_CLEANUP = (0, 0, 0, 0, 0)
+
+# Map tile used for each placement type when a card does not specify one
+_MAP_TILE_DEFAULTS: dict[str, int] = {
+    "expand_chain": 1,
+    "market": 1,
+    "coffee_shop": 1,
+    "develop_lobby": 1,
+}
+
+# Accessors for keys every card entry is required to have
+_get_number = itemgetter("number")
+_get_front = itemgetter("front")
+_get_back = itemgetter("back")
+_get_effect = itemgetter("effect")
 
 
 # ─── YAML → model converters ────────────────────────────────────────────────
 
 
+def _as_food_list(value) -> Optional[list[str]]:
+    """Normalize a YAML food-or-foods value to a list (None stays None)."""
+    if value is None:
+        return None
+    return value if isinstance(value, list) else [value]
+
+
 def _parse_action_slot(slot_num: int, raw: dict) -> ActionSlot:
     """Convert a YAML action dict into an ActionSlot."""
     return ActionSlot(
@@ -46,7 +77,7 @@ def _parse_action_slot(slot_num: int, raw: dict) -> ActionSlot:
         action_type=raw["type"],
         target=str(raw["target"]),
         requires_module=raw.get("module"),
-        fallback_food=raw.get("fallback"),
+        fallback_food=_as_food_list(raw.get("fallback")),
         star=raw.get("star"),
     )
 
@@ -62,10 +93,10 @@ def _parse_front(raw: dict) -> CardFront:
 
 def _parse_back(raw: dict) -> CardBack:
     """Convert a YAML back dict into a CardBack."""
-    cleanup_values = raw.get("cleanup", [0, 0, 0, 0, 0])
+    cleanup_values = raw.get("cleanup", _DEFAULT_CLEANUP)
     cleanup_actions = [
-        CleanupAction(action_type=k, value=int(v))
-        for k, v in zip(_CLEANUP_KEYS, cleanup_values)
+        CleanupAction(_CLEANUP_KEYS[i], int(cleanup_values[i]))
+        for i in range(min(len(_CLEANUP_KEYS), len(cleanup_values)))
     ]
     develop = raw.get("develop") or {}
     lobby = raw.get("lobby") or {}
@@ -88,32 +119,29 @@ def _parse_back(raw: dict) -> CardBack:
 
 def _parse_action_card(raw: dict) -> Card:
     """Convert a YAML action card entry into a Card."""
-    num = raw["number"]
+    num = _get_number(raw)
     mt = raw.get("map_tiles", {})
     return Card(
         id=num,
         card_type=CardType.ACTION,
         card_number=num,
-        front=_parse_front(raw["front"]),
-        back=_parse_back(raw["back"]),
-        map_tiles={
-            "expand_chain": mt.get("expand_chain", 1),
-            "market": mt.get("market", 1),
-            "coffee_shop": mt.get("coffee_shop", 1),
-            "develop_lobby": mt.get("develop_lobby", 1),
-        },
+        front=_parse_front(_get_front(raw)),
+        back=_parse_back(_get_back(raw)),
+        map_tiles=(
+            {**_MAP_TILE_DEFAULTS, **mt} if mt else _MAP_TILE_DEFAULTS.copy()
+        ),
     )
 
 
 def _parse_warm_card(raw: dict) -> Card:
     """Convert a YAML warm competition card entry into a Card."""
-    num = raw["number"]
+    num = _get_number(raw)
     return Card(
         id=100 + num,
         card_type=CardType.WARM,
         card_number=num,
         competition_effect=CompetitionEffect(
-            effect_type=raw["effect"],
+            effect_type=_get_effect(raw),
             food_adjustments=raw.get("food_adj", []),
             track_adjustments=raw.get("track_adj", []),
             inventory_boost=raw.get("boost", False),
@@ -124,13 +152,13 @@ def _parse_warm_card(raw: dict) -> Card:
 
 def _parse_cool_card(raw: dict) -> Card:
     """Convert a YAML cool competition card entry into a Card."""
-    num = raw["number"]
+    num = _get_number(raw)
     return Card(
         id=200 + num,
         card_type=CardType.COOL,
         card_number=num,
         competition_effect=CompetitionEffect(
-            effect_type=raw["effect"],
+            effect_type=_get_effect(raw),
             inventory_loss_items=raw.get("loss_items", []),
             track_adjustments=raw.get("track_adj", []),
             inventory_drop=raw.get("drop", False),
@@ -142,11 +170,19 @@ def _parse_cool_card(raw: dict) -> Card:
 # ─── Public API ──────────────────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=4)
+def _load_yaml_cached(path: Path) -> dict[str, Any]:
+    """Parse a YAML card file once; later calls reuse the parsed data.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def _load_yaml(path: Path | None = None) -> dict[str, Any]:
     """Load and return the parsed YAML card data."""
-    p = path or _CARDS_YAML
-    with open(p, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return _load_yaml_cached(Path(path or _CARDS_YAML))
 
 
 def build_action_deck(data: dict | None = None) -> list[Card]:
@@ -182,3 +218,17 @@ def create_all_decks(yaml_path: Path | None = None) -> tuple[Deck, Deck, Deck]:
     cool_deck = Deck(cards=build_cool_deck(data), name="Cool Competition")
 
     return action_deck, warm_deck, cool_deck
+
+
+@lru_cache(maxsize=1)
+def card_catalog() -> dict[tuple[str, int], Card]:
+    """Map (card_type value, card_number) to every card in the default card set.
+
+    Cards are frozen, so the catalog is built once and shared by undo and
+    save loading to turn stored card references back into cards.
+    """
+    action_deck, warm_deck, cool_deck = create_all_decks()
+    return {
+        (c.card_type.value, c.card_number): c
+        for c in action_deck.cards + warm_deck.cards + cool_deck.cards
+    }
@@ -1,8 +1,11 @@
 """Game engine for The Chain automa — handles the full turn flow."""
 
 from __future__ import annotations
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Optional
 import random
+import sys
 
 from .models import (
     GameState,
@@ -11,34 +14,254 @@ from .models import (
     CompetitionLevel,
     Card,
     CardType,
+    DemandType,
     Deck,
     Inventory,
     Tracks,
     MarketeerSlot,
+    PendingCompetitionAction,
     RECRUIT_TRAIN_TRACK,
     MARKETEER_DURATIONS,
     FoodItem,
     CORE_FOOD_ITEMS,
 )
-from .cards import create_all_decks
+from .cards import card_catalog, create_all_decks
 
 
-def _is_item_available(item: str, modules: dict) -> bool:
+def _input_type(input_data: dict) -> str:
+    """Return an input's type, interned so handler-table lookups match by identity."""
+    input_type = input_data.get("type", "")
+    return sys.intern(input_type) if isinstance(input_type, str) else str(input_type)
+
+
+# Every FoodItem value, for validating item names coming from card data
+_FOOD_ITEM_VALUES = frozenset(fi.value for fi in FoodItem)
+
+
+@lru_cache(maxsize=256)
+def _is_item_available(item: str, enabled_modules: frozenset[str]) -> bool:
     """Check whether a food/drink item is available given the active modules.
 
     Core items (burger, pizza, beer, lemonade, softdrink) are always available.
     Expansion items (sushi, noodle, coffee, kimchi) require their module to be on.
+    Takes state.enabled_modules so results can be memoized.
     """
-    if item in CORE_FOOD_ITEMS:
-        return True
-    return modules.get(item, False)
+    return item in CORE_FOOD_ITEMS or item in enabled_modules
+
+
+@lru_cache(maxsize=64)
+def _available_food_items(enabled_modules: frozenset[str]) -> tuple[str, ...]:
+    """FoodItem values available with the given enabled modules, in enum order."""
+    return tuple(
+        fi.value
+        for fi in FoodItem
+        if _is_item_available(fi.value, enabled_modules)
+    )
+
+
+def _clamp(value: int, lo: int, hi: int) -> int:
+    """Limit value to the range [lo, hi]."""
+    return lo if value < lo else hi if value > hi else value
+
+
+def _house_demand_leaders(tied_items: list, input_data: dict) -> tuple:
+    """Return (max_count, items) for the tied items with most demand on houses."""
+    max_count = 0
+    winners = []
+    for item in tied_items:
+        count = input_data.get(f"house_demand_{item}", 0)
+        if not winners or count > max_count:
+            max_count = count
+            winners = [item]
+        elif count == max_count:
+            winners.append(item)
+    return max_count, winners
+
+
+# Phase value string -> GamePhase, skipping Enum.__call__ on resume paths
+_PHASE_BY_VALUE = {p.value: p for p in GamePhase}
+
+# "all_demand" -> "All Demand", for competition card messages
+_DEMAND_LABELS = {d.value: d.value.replace("_", " ").title() for d in DemandType}
+
+# Shared read-only default for missing card sections
+_EMPTY = MappingProxyType({})
+
+# Card types that belong to the Warm/Cool competition decks
+_COMPETITION_CARD_TYPES = frozenset((CardType.WARM, CardType.COOL))
+
+# Reminder shown after the Chain's last worktime phase when it went first
+_WORKTIME_HINT_CHAIN_FIRST = (
+    " ⏩ Chain's worktime complete! Now do ALL your worktime phases "
+    "(Recruit & Train, Marketing, Get Food, Develop, Lobby, Expand) "
+    "before proceeding to Dinnertime."
+)
+
+# Results whose content never varies. They are returned as-is to callers
+# (and on to the API), so treat them as read-only.
+_RESULT_GAME_OVER = {"status": "game_over", "message": "The game has ended."}
+_RESULT_BEGIN_TURN_1 = {
+    "status": "ok",
+    "message": "Both restaurants placed. Begin Turn 1!",
+    "next_phase": "restructuring",
+}
+_RESULT_DINNERTIME_RESOLVED = {
+    "status": "ok",
+    "message": "Dinnertime resolved. Proceeding to Payday.",
+    "next_phase": "payday",
+}
+_RESULT_INVENTORY_UPDATED = {
+    "status": "ok",
+    "message": "Inventory updated. Proceeding to Payday.",
+    "next_phase": "payday",
+}
+_RESULT_PAYDAY = {
+    "status": "ok",
+    "message": "Payday — Pay your employees. The Chain does not pay salaries.",
+    "next_phase": "marketing_campaigns",
+}
+_RESULT_NOTHING_TO_UNDO = {"status": "error", "message": "Nothing to undo."}
+_RESULT_UNDONE = {"status": "ok", "message": "Last action undone."}
+
+_FOOD_LABELS_ES = {
+    "burger": "Hamburguesa",
+    "pizza": "Pizza",
+    "sushi": "Sushi",
+    "noodle": "Fideos",
+    "coffee": "Café",
+    "kimchi": "Kimchi",
+    "beer": "Cerveza",
+    "lemonade": "Limonada",
+    "softdrink": "Refresco",
+}
+
+# Food item -> (English, Spanish) field labels for the sold-items prompt
+_SOLD_ITEM_LABELS = {
+    fi.value: (
+        f"{fi.label()} sold",
+        f"{_FOOD_LABELS_ES.get(fi.value, fi.label())} vendido",
+    )
+    for fi in FoodItem
+}
+
+# Static parts of the numeric prompt fields, merged into each field dict
+_HOUSE_DEMAND_FIELD = {"type": "number", "min": 0, "max": 50, "default": 0}
+_CAMPAIGN_NUMBER_FIELD = {"type": "number", "min": 1, "max": 99, "default": 1}
+
+# Select field shared by every milestone availability prompt (read-only)
+_MILESTONE_AVAILABLE_FIELDS = [
+    {
+        "name": "available",
+        "label": "Is this milestone available for The Chain?",
+        "label_es": "¿Está disponible para La Cadena?",
+        "type": "select",
+        "options": ["yes", "no"],
+    },
+]
+
+# Earnings fields of the dinnertime prompt (read-only)
+_DINNERTIME_EARNINGS_FIELDS = [
+    {
+        "name": "chain_earned",
+        "label": "Chain earned ($)",
+        "label_es": "La Cadena ganó ($)",
+        "type": "number",
+        "min": 0,
+    },
+    {
+        "name": "player_earned",
+        "label": "You earned ($)",
+        "label_es": "Tú ganaste ($)",
+        "type": "number",
+        "min": 0,
+    },
+]
+
+
+def _milestone_prompt(key: str, en_name: str, es_name: str) -> dict:
+    """Build the pending_input asking whether a milestone is still available."""
+    return {
+        "type": "milestone_confirm",
+        "milestone_key": key,
+        "prompt": (
+            f"🏆 Milestone triggered: {en_name}.\n"
+            f"Is this milestone still available? (Has the player NOT claimed it yet?)"
+        ),
+        "prompt_es": (
+            f"🏆 Hito activado: {es_name}.\n"
+            f"¿Está este hito disponible? (¿El jugador NO lo ha reclamado aún?)"
+        ),
+        "fields": _MILESTONE_AVAILABLE_FIELDS,
+    }
+
+
+_OOB_PROMPT = (
+    "Order of Business — Determine turn order. "
+    "The Chain has {slots} open slot(s).{star}"
+)
+_OOB_PROMPT_ES = (
+    "Orden de juego — Determinar orden de turno. "
+    "La Cadena tiene {slots} casilla(s) abierta(s).{star}"
+)
+
+
+@lru_cache(maxsize=None)
+def _oob_prompts(chain_slots: int, chain_star: Optional[str]) -> tuple[str, str]:
+    """Order of Business (prompt, prompt_es) for a slot count and Chain star."""
+    star = f" Movie star: {chain_star}." if chain_star else ""
+    star_es = f" Estrella de cine: {chain_star}." if chain_star else ""
+    return (
+        _OOB_PROMPT.format(slots=chain_slots, star=star),
+        _OOB_PROMPT_ES.format(slots=chain_slots, star=star_es),
+    )
+
+
+@lru_cache(maxsize=None)
+def _oob_open_slots_field(chain_slots: int) -> dict:
+    """Order of Business open-slots field; one shared dict per slot count."""
+    return {
+        "name": "player_open_slots",
+        "label": f"How many open (unoccupied) slots do you have in your org chart? (The Chain has {chain_slots})",
+        "label_es": f"¿Cuántas casillas abiertas (sin ocupar) tienes en tu organigrama? (La Cadena tiene {chain_slots})",
+        "type": "number",
+        "min": 0,
+        "max": 50,
+        "default": 0,
+    }
+
+
+@lru_cache(maxsize=None)
+def _oob_movie_star_field(chain_star: Optional[str]) -> dict:
+    """Order of Business movie-star field; one shared dict per Chain star rank."""
+    star_info = (
+        f" The Chain has: {chain_star}-movie star."
+        if chain_star
+        else " The Chain has no movie star."
+    )
+    return {
+        "name": "player_movie_star",
+        "label": f"Do you have a movie star?{star_info}",
+        "label_es": f"¿Tienes una estrella de cine?{star_info}",
+        "type": "select",
+        "options": ["none", "B", "C", "D"],
+    }
 
 
 class GameEngine:
     """Manages the state machine and executes game phases."""
 
-    def __init__(self, state: Optional[GameState] = None):
+    def __init__(
+        self,
+        state: Optional[GameState] = None,
+        rng: Optional[random.Random] = None,
+        auto_input: Optional[Callable[[str, dict], dict]] = None,
+    ):
         self.state = state or GameState()
+        # Source of randomness for shuffles and random tiebreaks
+        self._rng = rng or random
+        # Scripted playouts: called as auto_input(input_type, context) to answer
+        # the Get Food and Initiate Marketing prompts without building them
+        self._auto_input = auto_input
 
     # ─── Game setup ──────────────────────────────────────────────────────
 
@@ -48,14 +271,23 @@ class GameEngine:
         optional_rules: dict = None,
         mode: str = "full",
         language: str = "en",
+        rng: Optional[random.Random] = None,
     ) -> dict:
-        """Initialize a new game."""
+        """Initialize a new game.
+
+        Pass rng (e.g. a seeded random.Random) to make the game reproducible;
+        it is kept for the rest of the game's shuffles and tiebreaks.
+        """
+        if rng is not None:
+            self._rng = rng
+        rng = self._rng
         self.state = GameState()
         self.state.mode = GameMode(mode)
         self.state.language = language
 
         if modules:
             self.state.modules.update(modules)
+            self.state.modules_changed()
         if optional_rules:
             self.state.optional_rules.update(optional_rules)
 
@@ -65,9 +297,9 @@ class GameEngine:
 
         # Create and shuffle decks
         action_deck, warm_deck, cool_deck = create_all_decks()
-        action_deck.shuffle()
-        warm_deck.shuffle()
-        cool_deck.shuffle()
+        action_deck.shuffle(rng)
+        warm_deck.shuffle(rng)
+        cool_deck.shuffle(rng)
 
         self.state.action_deck = action_deck
         self.state.warm_deck = warm_deck
@@ -76,20 +308,12 @@ class GameEngine:
         # Place initial competition cards under the action deck (3 warm + 3 cool)
         if self.state.optional_rules.get("aggressive_setup"):
             # Optional: 6 warm, 0 cool
-            for _ in range(6):
-                card = self.state.warm_deck.draw()
-                if card:
-                    self.state.action_deck.place_under(card)
+            comp_cards = self.state.warm_deck.draw_many(6)
         else:
             # Standard: 3 warm + 3 cool
-            for _ in range(3):
-                card = self.state.warm_deck.draw()
-                if card:
-                    self.state.action_deck.place_under(card)
-            for _ in range(3):
-                card = self.state.cool_deck.draw()
-                if card:
-                    self.state.action_deck.place_under(card)
+            comp_cards = self.state.warm_deck.draw_many(3)
+            comp_cards += self.state.cool_deck.draw_many(3)
+        self.state.action_deck.place_many_under(comp_cards)
 
         # Set initial track positions
         self.state.tracks.recruit_train.position = 1
@@ -102,7 +326,7 @@ class GameEngine:
         self.state.is_first_turn = True
 
         # Secretly pick one of the three bank reserve cards (revealed on first bank break)
-        self.state.bank_reserve_card = random.choice(["100", "200", "300"])
+        self.state.bank_reserve_card = rng.choice(["100", "200", "300"])
 
         self.state.log("New game started!", "setup")
         self.state.log(
@@ -110,6 +334,7 @@ class GameEngine:
             "setup",
         )
         self.state.log(f"Action Deck: {self.state.action_deck.size()} cards", "setup")
+        self.state.flush_log()
 
         return {
             "status": "ok",
@@ -150,6 +375,27 @@ class GameEngine:
         ),
     }
 
+    # Prebuilt milestone_confirm prompts, shared across calls (read-only)
+    _MILESTONE_PROMPTS = {
+        key: _milestone_prompt(key, en, es)
+        for key, (en, es) in MILESTONE_LABELS.items()
+    }
+
+    def _front_map_tiles(self):
+        """Map tile targets printed on the current front card."""
+        front_card = self.state.current_front_card
+        return front_card.get("map_tiles", _EMPTY) if front_card else _EMPTY
+
+    def _front_actions(self):
+        """Action section of the current front card."""
+        front_card = self.state.current_front_card
+        return front_card.get("front", _EMPTY) if front_card else _EMPTY
+
+    def _back_side(self):
+        """Back side (demand, food, cleanup) of the current back card."""
+        back_card = self.state.current_back_card
+        return back_card.get("back", _EMPTY) if back_card else _EMPTY
+
     def _check_track_milestones(self):
         """Queue track-based milestones for user confirmation after any track movement.
 
@@ -161,37 +407,36 @@ class GameEngine:
         so the user can confirm whether the milestone is still available (not already
         claimed by the human player).
         """
-        skip = (
-            set(self.state.milestones_claimed)
-            | set(self.state.milestones_unavailable)
-            | set(self.state.pending_milestone_checks)
-        )
-        open_slots = self.state.tracks.get_open_slots()
+        st = self.state
+        claimed = st.milestones_claimed
+        unavailable = st.milestones_unavailable
+        pending = st.pending_milestone_checks
 
-        if open_slots >= 2 and "first_to_train" not in skip:
-            self.state.pending_milestone_checks.append("first_to_train")
-            self.state.log(
+        def skip(key: str) -> bool:
+            return key in claimed or key in unavailable or key in pending
+
+        open_slots = st.tracks.open_slots
+
+        if open_slots >= 2 and not skip("first_to_train"):
+            pending.append("first_to_train")
+            st.log(
                 "Milestone triggered: First to Train Someone — awaiting confirmation.",
                 "milestone",
             )
 
-        if open_slots >= 3 and "first_to_hire_3" not in skip:
-            self.state.pending_milestone_checks.append("first_to_hire_3")
-            self.state.log(
+        if open_slots >= 3 and not skip("first_to_hire_3"):
+            pending.append("first_to_hire_3")
+            st.log(
                 "Milestone triggered: First to Hire 3 People in 1 Turn — awaiting confirmation.",
                 "milestone",
             )
 
-        pd_pos = self.state.tracks.price_distance.position
-        if pd_pos < 10 and "first_to_lower_prices" not in skip:
-            has_food = any(
-                count > 0
-                for item, count in self.state.inventory.items.items()
-                if _is_item_available(item, self.state.modules)
-            )
-            if has_food:
-                self.state.pending_milestone_checks.append("first_to_lower_prices")
-                self.state.log(
+        pd_pos = st.tracks.price_distance.position
+        if pd_pos < 10 and not skip("first_to_lower_prices"):
+            enabled = st.enabled_modules
+            if st.inventory.has_available(enabled):
+                pending.append("first_to_lower_prices")
+                st.log(
                     "Milestone triggered: First to Lower Prices — awaiting confirmation.",
                     "milestone",
                 )
@@ -214,27 +459,10 @@ class GameEngine:
         if self.state.phase_before_milestone is None:
             self.state.phase_before_milestone = self.state.phase.value
 
-        self.state.pending_input = {
-            "type": "milestone_confirm",
-            "milestone_key": milestone,
-            "prompt": (
-                f"🏆 Milestone triggered: {en_name}.\n"
-                f"Is this milestone still available? (Has the player NOT claimed it yet?)"
-            ),
-            "prompt_es": (
-                f"🏆 Hito activado: {es_name}.\n"
-                f"¿Está este hito disponible? (¿El jugador NO lo ha reclamado aún?)"
-            ),
-            "fields": [
-                {
-                    "name": "available",
-                    "label": "Is this milestone available for The Chain?",
-                    "label_es": "¿Está disponible para La Cadena?",
-                    "type": "select",
-                    "options": ["yes", "no"],
-                },
-            ],
-        }
+        prompt = self._MILESTONE_PROMPTS.get(milestone)
+        if prompt is None:
+            prompt = _milestone_prompt(milestone, en_name, es_name)
+        self.state.pending_input = prompt
         self.state.phase = GamePhase.WAITING_FOR_INPUT
 
         # Preserve the original phase message so the UI can show it
@@ -319,58 +547,80 @@ class GameEngine:
         - player_first: no per-phase hint (player already did all theirs).
         """
         if is_last_worktime and self.state.turn_order == "chain_first":
-            return (
-                " ⏩ Chain's worktime complete! Now do ALL your worktime phases "
-                "(Recruit & Train, Marketing, Get Food, Develop, Lobby, Expand) "
-                "before proceeding to Dinnertime."
-            )
+            return _WORKTIME_HINT_CHAIN_FIRST
         return ""
 
+    # phase -> handler method name
+    _PHASE_HANDLERS = {
+        GamePhase.SETUP: "_do_first_turn",
+        GamePhase.RESTRUCTURING: "_do_restructuring",
+        GamePhase.ORDER_OF_BUSINESS: "_do_order_of_business",
+        GamePhase.RECRUIT_TRAIN: "_do_recruit_train",
+        GamePhase.GET_FOOD: "_do_get_food",
+        GamePhase.INITIATE_MARKETING: "_do_initiate_marketing",
+        GamePhase.DEVELOP: "_do_develop",
+        GamePhase.LOBBY: "_do_lobby",
+        GamePhase.EXPAND_CHAIN: "_do_expand_chain",
+        GamePhase.DINNERTIME: "_do_dinnertime_prompt",
+        GamePhase.PAYDAY: "_do_payday",
+        GamePhase.MARKETING_CAMPAIGNS: "_do_marketing_campaigns",
+        GamePhase.CLEANUP: "_do_cleanup",
+        GamePhase.GAME_OVER: "_do_game_over",
+    }
+
+    # Turn order: the phase each handler hands over to when it finishes
+    # without waiting for input
+    _PHASE_NEXT = {
+        GamePhase.ORDER_OF_BUSINESS: GamePhase.RECRUIT_TRAIN,
+        GamePhase.RECRUIT_TRAIN: GamePhase.INITIATE_MARKETING,
+        GamePhase.INITIATE_MARKETING: GamePhase.GET_FOOD,
+        GamePhase.GET_FOOD: GamePhase.DEVELOP,
+        GamePhase.DEVELOP: GamePhase.LOBBY,
+        GamePhase.LOBBY: GamePhase.EXPAND_CHAIN,
+        GamePhase.EXPAND_CHAIN: GamePhase.DINNERTIME,
+        GamePhase.DINNERTIME: GamePhase.PAYDAY,
+        GamePhase.PAYDAY: GamePhase.MARKETING_CAMPAIGNS,
+        GamePhase.MARKETING_CAMPAIGNS: GamePhase.CLEANUP,
+        GamePhase.CLEANUP: GamePhase.RESTRUCTURING,
+    }
+
+    def _advance(self, to: Optional[GamePhase] = None):
+        """Move to `to`, or to the phase after the current one in turn order."""
+        self.state.phase = to or self._PHASE_NEXT[self.state.phase]
+
     def advance_phase(self) -> dict:
         """Advance to the next phase and execute it. Returns result dict."""
-        self.state.save_snapshot()
-        phase = self.state.phase
+        st = self.state
+        st.save_snapshot()
+        phase = st.phase
 
         # Resume after a delayed phase transition (input resolved, user reviewed)
-        if phase == GamePhase.WAITING_FOR_INPUT and self.state.next_phase_after_input:
-            next_p = self.state.next_phase_after_input
-            self.state.next_phase_after_input = None
-            self.state.phase = GamePhase(next_p)
-            self.state.display_phase = next_p
-            phase = self.state.phase  # update local var for handler lookup
+        if phase == GamePhase.WAITING_FOR_INPUT and st.next_phase_after_input:
+            next_p = st.next_phase_after_input
+            st.next_phase_after_input = None
+            st.phase = _PHASE_BY_VALUE[next_p]
+            st.display_phase = next_p
+            phase = st.phase  # update local var for handler lookup
 
         # Track the phase being executed for display purposes
         # (handlers transition state.phase to the NEXT phase, but the UI
         # should show the phase that is currently running)
         elif phase != GamePhase.WAITING_FOR_INPUT:
-            self.state.display_phase = phase.value
-
-        handlers = {
-            GamePhase.SETUP: self._do_first_turn,
-            GamePhase.RESTRUCTURING: self._do_restructuring,
-            GamePhase.ORDER_OF_BUSINESS: self._do_order_of_business,
-            GamePhase.RECRUIT_TRAIN: self._do_recruit_train,
-            GamePhase.GET_FOOD: self._do_get_food,
-            GamePhase.INITIATE_MARKETING: self._do_initiate_marketing,
-            GamePhase.DEVELOP: self._do_develop,
-            GamePhase.LOBBY: self._do_lobby,
-            GamePhase.EXPAND_CHAIN: self._do_expand_chain,
-            GamePhase.DINNERTIME: self._do_dinnertime_prompt,
-            GamePhase.PAYDAY: self._do_payday,
-            GamePhase.MARKETING_CAMPAIGNS: self._do_marketing_campaigns,
-            GamePhase.CLEANUP: self._do_cleanup,
-            GamePhase.GAME_OVER: lambda: {
-                "status": "game_over",
-                "message": "The game has ended.",
-            },
-        }
+            st.display_phase = phase.value
 
-        handler = handlers.get(phase)
-        if handler:
-            result = handler()
+        handler_name = self._PHASE_HANDLERS.get(phase)
+        if handler_name:
+            result = getattr(self, handler_name)()
             result = self._prompt_pending_employee_checks(result)
-            return self._prompt_pending_milestones(result)
-        return {"status": "error", "message": f"Unknown phase: {phase.value}"}
+            result = self._prompt_pending_milestones(result)
+        else:
+            result = {"status": "error", "message": f"Unknown phase: {phase.value}"}
+        st.flush_log()
+        return result
+
+    def _do_game_over(self) -> dict:
+        """GAME OVER: nothing left to run."""
+        return _RESULT_GAME_OVER
 
     # Input types that should auto-advance (setup flow, not game phase transitions)
     _AUTO_ADVANCE_INPUTS = {
@@ -390,326 +640,359 @@ class GameEngine:
         transition is delayed: the result is shown to the player, and they
         must click Advance to proceed to the next phase.
         """
-        self.state.save_snapshot()
+        st = self.state
+        st.save_snapshot()
         result = self._dispatch_input(input_data)
 
         # Delay phase transitions so the player can review results
-        input_type = input_data.get("type", "")
+        input_type = _input_type(input_data)
         if (
             input_type not in self._AUTO_ADVANCE_INPUTS
             and result.get("status") == "ok"
             and result.get("next_phase")
         ):
-            self.state.next_phase_after_input = result["next_phase"]
-            self.state.phase = GamePhase.WAITING_FOR_INPUT
-            self.state.pending_input = None
+            st.next_phase_after_input = result["next_phase"]
+            st.phase = GamePhase.WAITING_FOR_INPUT
+            st.pending_input = None
 
+        st.flush_log()
         return result
 
+    # input type -> handler method name
+    _INPUT_HANDLERS = {
+        "first_restaurant_placed": "_on_first_restaurant_placed",
+        "player_first_restaurant_placed": "_on_player_first_restaurant_placed",
+        "dinnertime_result": "_on_dinnertime_result",
+        "dinnertime_sold_items": "_on_dinnertime_sold_items",
+        "demand_info": "_on_demand_info",
+        "demand_tiebreak": "_on_demand_tiebreak",
+        "competition_restaurant_placed": "_on_competition_restaurant_placed",
+        "competition_demand_info": "_on_competition_demand_info",
+        "competition_demand_tiebreak": "_on_competition_demand_tiebreak",
+        "initiate_marketing_campaigns": "_on_initiate_marketing_campaigns",
+        "order_of_business": "_on_order_of_business",
+        "bank_break": "_on_bank_break",
+        "acknowledge_competition_card": "_on_acknowledge_competition_card",
+        "restaurant_placed": "_on_restaurant_placed",
+        "acknowledge": "_on_acknowledge",
+        "milestone_confirm": "_on_milestone_confirm",
+        "employee_available_confirm": "_on_employee_available_confirm",
+    }
+
     def _dispatch_input(self, input_data: dict) -> dict:
         """Route input to the appropriate handler."""
-        input_type = input_data.get("type", "")
+        input_type = _input_type(input_data)
+        handler_name = self._INPUT_HANDLERS.get(input_type)
+        if handler_name is None:
+            return {"status": "error", "message": f"Unknown input type: {input_type}"}
+        return getattr(self, handler_name)(input_data)
 
-        if input_type == "first_restaurant_placed":
-            self.state.restaurants.append(
-                {
-                    "tile": input_data.get("tile", 1),
-                    "position": input_data.get("position", ""),
-                }
-            )
-            self.state.log("The Chain placed its first restaurant.", "setup")
-            self.state.is_first_turn = False
+    # ─── Input handlers ──────────────────────────────────────────────────
 
-            # Prompt the player to place their first restaurant
-            self.state.pending_input = {
-                "type": "player_first_restaurant_placed",
-                "prompt": "Now place YOUR first restaurant on the map and confirm.",
-                "prompt_es": "Ahora coloca TU primer restaurante en el mapa y confirma.",
-                "fields": [],
-            }
-            self.state.phase = GamePhase.WAITING_FOR_INPUT
-            return {
-                "status": "waiting",
-                "message": "The Chain placed its restaurant. Now place yours.",
-                "input_needed": self.state.pending_input,
+    def _on_first_restaurant_placed(self, input_data: dict) -> dict:
+        """Record The Chain's first restaurant and prompt for the player's."""
+        self.state.restaurants.append(
+            {
+                "tile": input_data.get("tile", 1),
+                "position": input_data.get("position", ""),
             }
+        )
+        self.state.log("The Chain placed its first restaurant.", "setup")
+        self.state.is_first_turn = False
 
-        elif input_type == "player_first_restaurant_placed":
-            self.state.pending_input = None
-            self.state.log("Player placed their first restaurant.", "setup")
-            self.state.turn_number = 1
-            self.state.phase = GamePhase.RESTRUCTURING
-            return {
-                "status": "ok",
-                "message": "Both restaurants placed. Begin Turn 1!",
-                "next_phase": "restructuring",
-            }
+        # Prompt the player to place their first restaurant
+        self.state.pending_input = {
+            "type": "player_first_restaurant_placed",
+            "prompt": "Now place YOUR first restaurant on the map and confirm.",
+            "prompt_es": "Ahora coloca TU primer restaurante en el mapa y confirma.",
+            "fields": [],
+        }
+        self.state.phase = GamePhase.WAITING_FOR_INPUT
+        return {
+            "status": "waiting",
+            "message": "The Chain placed its restaurant. Now place yours.",
+            "input_needed": self.state.pending_input,
+        }
 
-        elif input_type == "dinnertime_result":
-            chain_earned = input_data.get("chain_earned", 0)
-            player_earned = input_data.get("player_earned", 0)
+    def _on_player_first_restaurant_placed(self, input_data: dict) -> dict:
+        """Start turn 1 once both first restaurants are on the map."""
+        self.state.pending_input = None
+        self.state.log("Player placed their first restaurant.", "setup")
+        self.state.turn_number = 1
+        self.state.phase = GamePhase.RESTRUCTURING
+        return _RESULT_BEGIN_TURN_1
+
+    def _on_dinnertime_result(self, input_data: dict) -> dict:
+        """Apply dinnertime earnings to cash and the competition track."""
+        chain_earned = input_data.get("chain_earned", 0)
+        player_earned = input_data.get("player_earned", 0)
+
+        # Apply bonus cash multiplier
+        chain_earned = int(chain_earned * self.state.bonus_cash_multiplier)
+        self.state.chain_cash_this_turn = chain_earned
+        self.state.chain_total_cash += chain_earned
+
+        self._record_dinnertime_competition(chain_earned, player_earned)
+
+        # If the Chain sold anything, ask user what was sold to update inventory
+        if chain_earned > 0:
+            sold_prompt = self._build_sold_items_prompt()
+            if sold_prompt is not None:
+                return sold_prompt
+
+        self.state.phase = GamePhase.PAYDAY
+        return _RESULT_DINNERTIME_RESOLVED
+
+    def _record_dinnertime_competition(self, chain_earned: int, player_earned: int):
+        """Move the competition track by the dinnertime comparison and log it."""
+        # +1 toward HOT when the player out-earned the Chain, -1 toward COLD
+        delta = (chain_earned < player_earned) - (chain_earned > player_earned)
+        if not delta:
+            self.state.log(
+                f"Chain and Player earned equal (${chain_earned}). Competition unchanged.",
+                "dinnertime",
+            )
+            return
+        tracks = self.state.tracks
+        old = tracks.competition
+        tracks.move_competition(delta)
+        self.state.log(
+            f"Chain earned ${chain_earned} {'<' if delta > 0 else '>'} Player ${player_earned}. "
+            f"Competition: {old.label()} → {tracks.competition.label()}",
+            "dinnertime",
+        )
 
-            # Apply bonus cash multiplier
-            chain_earned = int(chain_earned * self.state.bonus_cash_multiplier)
-            self.state.chain_cash_this_turn = chain_earned
-            self.state.chain_total_cash += chain_earned
+    def _on_dinnertime_sold_items(self, input_data: dict) -> dict:
+        """Remove the items the Chain sold at dinnertime from inventory."""
+        sold_msgs = []
+        for key, qty in input_data.items():
+            if key == "type":
+                continue
+            qty = int(qty)
+            if qty > 0 and key in self.state.inventory.items:
+                removed = self.state.inventory.remove(key, qty)
+                if removed > 0:
+                    sold_msgs.append(f"{key} ×{removed}")
+
+        if sold_msgs:
+            self.state.log(f"Sold: {', '.join(sold_msgs)}", "dinnertime")
+        else:
+            self.state.log("No items sold from inventory.", "dinnertime")
 
-            # Competition adjustment
-            if chain_earned > player_earned:
-                old = self.state.tracks.competition
-                self.state.tracks.move_competition(-1)  # Move toward COLD
-                self.state.log(
-                    f"Chain earned ${chain_earned} > Player ${player_earned}. "
-                    f"Competition: {old.label()} → {self.state.tracks.competition.label()}",
-                    "dinnertime",
-                )
-            elif chain_earned < player_earned:
-                old = self.state.tracks.competition
-                self.state.tracks.move_competition(1)  # Move toward HOT
-                self.state.log(
-                    f"Chain earned ${chain_earned} < Player ${player_earned}. "
-                    f"Competition: {old.label()} → {self.state.tracks.competition.label()}",
-                    "dinnertime",
-                )
-            else:
-                self.state.log(
-                    f"Chain and Player earned equal (${chain_earned}). Competition unchanged.",
-                    "dinnertime",
-                )
+        self.state.phase = GamePhase.PAYDAY
+        return _RESULT_INVENTORY_UPDATED
 
-            # If the Chain sold anything, ask user what was sold to update inventory
-            if chain_earned > 0:
-                sold_prompt = self._build_sold_items_prompt()
-                if sold_prompt is not None:
-                    return sold_prompt
+    def _on_demand_info(self, input_data: dict) -> dict:
+        """Resolve Get Food with the demand reported on the map."""
+        # Player provides which food items have demand on the map
+        self.state.pending_input = None
+        return self._resolve_get_food(input_data)
+
+    def _on_demand_tiebreak(self, input_data: dict) -> dict:
+        """Resolve a most-demand tie from house demand counts."""
+        # Player provides house demand counts to break a tie
+        return self._resolve_demand_tiebreak(input_data)
+
+    def _on_competition_restaurant_placed(self, input_data: dict) -> dict:
+        """Record a restaurant placed by a competition card effect."""
+        # Restaurant placed from competition card effect
+        tile = input_data.get("tile", 1)
+        self.state.restaurants.append(
+            {"tile": tile, "position": input_data.get("position", "")}
+        )
+        self.state.log(
+            f"Competition card: restaurant placed on tile {tile}.", "competition"
+        )
+        self.state.pending_input = None
+        return self._resume_after_competition()
 
-            self.state.phase = GamePhase.PAYDAY
+    def _on_competition_demand_info(self, input_data: dict) -> dict:
+        """Resolve demand info for a competition card effect."""
+        # Demand info from competition card effect
+        # Note: pending_input is NOT cleared yet — _resolve_competition_demand reads it
+        return self._resolve_competition_demand(input_data)
+
+    def _on_competition_demand_tiebreak(self, input_data: dict) -> dict:
+        """Resolve a most-demand tie for a competition card effect."""
+        # Tiebreak for competition card demand
+        return self._resolve_competition_demand_tiebreak(input_data)
+
+    def _on_initiate_marketing_campaigns(self, input_data: dict) -> dict:
+        """Assign campaign numbers to newly placed marketeers."""
+        return self._resolve_initiate_marketing(input_data)
+
+    def _on_order_of_business(self, input_data: dict) -> dict:
+        """Determine turn order from the player's open slots."""
+        return self._resolve_order_of_business(input_data)
+
+    def _on_bank_break(self, input_data: dict) -> dict:
+        """Record a bank break; the second one ends the game."""
+        self.state.bank_breaks += 1
+        self.state.log(f"Bank break #{self.state.bank_breaks}!", "game")
+        if self.state.bank_breaks >= 2:
+            self.state.phase = GamePhase.GAME_OVER
+            self.state.log("Second bank break! Game over!", "game")
             return {
-                "status": "ok",
-                "message": "Dinnertime resolved. Proceeding to Payday.",
-                "next_phase": "payday",
+                "status": "game_over",
+                "message": "Second bank break! The game is over!",
             }
+        # First bank break — reveal the secretly chosen reserve card
+        return {
+            "status": "ok",
+            "message": f"Bank break #{self.state.bank_breaks} recorded.",
+            "reveal_reserve_card": self.state.bank_reserve_card,
+        }
 
-        elif input_type == "dinnertime_sold_items":
-            sold_msgs = []
-            for key, qty in input_data.items():
-                if key == "type":
-                    continue
-                qty = int(qty)
-                if qty > 0 and key in self.state.inventory.items:
-                    removed = self.state.inventory.remove(key, qty)
-                    if removed > 0:
-                        sold_msgs.append(f"{key} ×{removed}")
-
-            if sold_msgs:
-                self.state.log(f"Sold: {', '.join(sold_msgs)}", "dinnertime")
-            else:
-                self.state.log("No items sold from inventory.", "dinnertime")
-
-            self.state.phase = GamePhase.PAYDAY
-            return {
-                "status": "ok",
-                "message": "Inventory updated. Proceeding to Payday.",
-                "next_phase": "payday",
-            }
+    def _on_acknowledge_competition_card(self, input_data: dict) -> dict:
+        """Resolve the stacked competition card the player was shown."""
+        self.state.pending_input = None
+        # Resolve the stacked competition card the player was just shown
+        top = self.state.action_deck.peek_if(_COMPETITION_CARD_TYPES)
+        if top:
+            msg = self._check_resolve_competition(top)
+            self.state.log(
+                f"Resolved stacked competition card: {msg}", "competition"
+            )
+            # If yet another competition card is on top, queue it
+            if self.state.action_deck.peek_if(_COMPETITION_CARD_TYPES):
+                self.state.pending_competition_actions.appendleft(
+                    PendingCompetitionAction("check_stacked_competition")
+                )
+            final_top = self.state.action_deck.peek()
+            if final_top:
+                self.state.current_front_card = final_top.as_dict
+        return self._resume_after_competition()
 
-        elif input_type == "demand_info":
-            # Player provides which food items have demand on the map
-            self.state.pending_input = None
-            return self._resolve_get_food(input_data)
+    def _on_restaurant_placed(self, input_data: dict) -> dict:
+        """Record a restaurant placed by the EXPAND CHAIN star."""
+        tile = input_data.get("tile", 1)
+        self.state.restaurants.append(
+            {"tile": tile, "position": input_data.get("position", "")}
+        )
+        self.state.log(f"New restaurant placed on tile {tile}.", "expand")
+        self.state.pending_input = None
+        return self._continue_after_stars()
 
-        elif input_type == "demand_tiebreak":
-            # Player provides house demand counts to break a tie
-            return self._resolve_demand_tiebreak(input_data)
+    def _on_acknowledge(self, input_data: dict) -> dict:
+        """Clear an acknowledged instruction and continue to Dinnertime."""
+        # Player acknowledges an instruction
+        self.state.pending_input = None
+        return self._continue_after_stars()
+
+    def _on_milestone_confirm(self, input_data: dict) -> dict:
+        """Claim or mark unavailable the milestone being confirmed."""
+        milestone_key = (self.state.pending_input or {}).get("milestone_key", "")
+        available = input_data.get("available", "yes")
+        en_name, _ = self.MILESTONE_LABELS.get(
+            milestone_key, (milestone_key, milestone_key)
+        )
+        self.state.pending_input = None
 
-        elif input_type == "competition_restaurant_placed":
-            # Restaurant placed from competition card effect
-            tile = input_data.get("tile", 1)
-            self.state.restaurants.append(
-                {"tile": tile, "position": input_data.get("position", "")}
-            )
+        # Remove from pending checks (normally the head of the queue)
+        pending = self.state.pending_milestone_checks
+        if pending and pending[0] == milestone_key:
+            pending.popleft()
+        elif milestone_key in pending:
+            pending.remove(milestone_key)
+
+        if available == "yes":
+            self.state.milestones_claimed[milestone_key] = None
+            self.state.log(f"Milestone claimed: {en_name}!", "milestone")
+            msg = f"The Chain claimed: {en_name}"
+        else:
+            self.state.milestones_unavailable[milestone_key] = None
             self.state.log(
-                f"Competition card: restaurant placed on tile {tile}.", "competition"
+                f"Milestone unavailable (player has it): {en_name}.",
+                "milestone",
             )
-            self.state.pending_input = None
-            return self._resume_after_competition()
-
-        elif input_type == "competition_demand_info":
-            # Demand info from competition card effect
-            # Note: pending_input is NOT cleared yet — _resolve_competition_demand reads it
-            return self._resolve_competition_demand(input_data)
-
-        elif input_type == "competition_demand_tiebreak":
-            # Tiebreak for competition card demand
-            return self._resolve_competition_demand_tiebreak(input_data)
-
-        elif input_type == "initiate_marketing_campaigns":
-            return self._resolve_initiate_marketing(input_data)
-
-        elif input_type == "order_of_business":
-            return self._resolve_order_of_business(input_data)
-
-        elif input_type == "bank_break":
-            self.state.bank_breaks += 1
-            self.state.log(f"Bank break #{self.state.bank_breaks}!", "game")
-            if self.state.bank_breaks >= 2:
-                self.state.phase = GamePhase.GAME_OVER
-                self.state.log("Second bank break! Game over!", "game")
-                return {
-                    "status": "game_over",
-                    "message": "Second bank break! The game is over!",
-                }
-            # First bank break — reveal the secretly chosen reserve card
-            return {
-                "status": "ok",
-                "message": f"Bank break #{self.state.bank_breaks} recorded.",
-                "reveal_reserve_card": self.state.bank_reserve_card,
-            }
+            msg = f"Milestone already claimed by player: {en_name}"
 
-        elif input_type == "acknowledge_competition_card":
-            self.state.pending_input = None
-            # Resolve the stacked competition card the player was just shown
-            top = self.state.action_deck.peek()
-            if top and top.card_type in (CardType.WARM, CardType.COOL):
-                msg = self._check_resolve_competition(top)
-                self.state.log(
-                    f"Resolved stacked competition card: {msg}", "competition"
-                )
-                # If yet another competition card is on top, queue it
-                next_top = self.state.action_deck.peek()
-                if next_top and next_top.card_type in (CardType.WARM, CardType.COOL):
-                    self.state.pending_competition_actions.insert(
-                        0, {"action": "check_stacked_competition"}
-                    )
-                final_top = self.state.action_deck.peek()
-                if final_top:
-                    self.state.current_front_card = final_top.to_dict()
-            return self._resume_after_competition()
-
-        elif input_type == "restaurant_placed":
-            tile = input_data.get("tile", 1)
-            self.state.restaurants.append(
-                {"tile": tile, "position": input_data.get("position", "")}
-            )
-            self.state.log(f"New restaurant placed on tile {tile}.", "expand")
-            self.state.pending_input = None
-            return self._continue_after_stars()
-
-        elif input_type == "acknowledge":
-            # Player acknowledges an instruction
-            self.state.pending_input = None
-            return self._continue_after_stars()
-
-        elif input_type == "milestone_confirm":
-            milestone_key = (self.state.pending_input or {}).get("milestone_key", "")
-            available = input_data.get("available", "yes")
-            en_name, _ = self.MILESTONE_LABELS.get(
-                milestone_key, (milestone_key, milestone_key)
-            )
-            self.state.pending_input = None
+        # If more milestones pending, prompt next one
+        if self.state.pending_milestone_checks:
+            return self._prompt_pending_milestones({"status": "ok", "message": msg})
 
-            # Remove from pending checks
-            if milestone_key in self.state.pending_milestone_checks:
-                self.state.pending_milestone_checks.remove(milestone_key)
+        # All milestones resolved — restore the phase before interruption
+        if self.state.phase_before_milestone:
+            self.state.phase = _PHASE_BY_VALUE[self.state.phase_before_milestone]
+            self.state.phase_before_milestone = None
 
-            if available == "yes":
-                self.state.milestones_claimed.append(milestone_key)
-                self.state.log(f"Milestone claimed: {en_name}!", "milestone")
-                msg = f"The Chain claimed: {en_name}"
-            else:
-                self.state.milestones_unavailable.append(milestone_key)
-                self.state.log(
-                    f"Milestone unavailable (player has it): {en_name}.",
-                    "milestone",
-                )
-                msg = f"Milestone already claimed by player: {en_name}"
-
-            # If more milestones pending, prompt next one
-            if self.state.pending_milestone_checks:
-                return self._prompt_pending_milestones({"status": "ok", "message": msg})
-
-            # All milestones resolved — restore the phase before interruption
-            if self.state.phase_before_milestone:
-                self.state.phase = GamePhase(self.state.phase_before_milestone)
-                self.state.phase_before_milestone = None
-
-            return {"status": "ok", "message": msg}
-
-        elif input_type == "employee_available_confirm":
-            check = (self.state.pending_input or {}).get("employee_check", {})
-            name = check.get("name", "")
-            recruit_type = check.get("type", "employee")
-            available = input_data.get("available", "yes")
-            self.state.pending_input = None
-
-            # Remove from pending checks
-            if check in self.state.pending_employee_checks:
-                self.state.pending_employee_checks.remove(check)
-
-            if available == "yes":
-                if recruit_type == "brand_director":
-                    placed = False
-                    for slot in self.state.marketeer_slots:
-                        if slot.marketeer is None:
-                            slot.marketeer = "Brand Director"
-                            self.state.log(
-                                f"Brand Director placed in Marketeer slot {slot.slot_number}.",
-                                "recruit_train",
-                            )
-                            placed = True
-                            break
-                    if not placed:
+        return {"status": "ok", "message": msg}
+
+    def _on_employee_available_confirm(self, input_data: dict) -> dict:
+        """Recruit or skip the employee whose availability was checked."""
+        check = (self.state.pending_input or {}).get("employee_check", {})
+        name = check.get("name", "")
+        recruit_type = check.get("type", "employee")
+        available = input_data.get("available", "yes")
+        self.state.pending_input = None
+
+        # Remove from pending checks
+        if check in self.state.pending_employee_checks:
+            self.state.pending_employee_checks.remove(check)
+
+        if available == "yes":
+            if recruit_type == "brand_director":
+                placed = False
+                for slot in self.state.marketeer_slots:
+                    if slot.marketeer is None:
+                        slot.marketeer = "Brand Director"
                         self.state.log(
-                            "No marketeer slot for Brand Director.", "recruit_train"
+                            f"Brand Director placed in Marketeer slot {slot.slot_number}.",
+                            "recruit_train",
                         )
-                    msg = (
-                        "Recruited: Brand Director"
-                        if placed
-                        else "No slot for Brand Director"
-                    )
-                else:
-                    self.state.employee_pile.append(name)
+                        placed = True
+                        break
+                if not placed:
                     self.state.log(
-                        f"Recruited {name} to Employee Pile.", "recruit_train"
+                        "No marketeer slot for Brand Director.", "recruit_train"
                     )
-                    msg = f"Recruited: {name}"
+                msg = (
+                    "Recruited: Brand Director"
+                    if placed
+                    else "No slot for Brand Director"
+                )
             else:
+                self.state.employee_pile.append(name)
                 self.state.log(
-                    f"{name} not available (player has it). Skipping.",
-                    "recruit_train",
-                )
-                msg = f"{name} not available (player has it)"
-
-            # If more employee checks pending, prompt next one
-            if self.state.pending_employee_checks:
-                return self._prompt_pending_employee_checks(
-                    {"status": "ok", "message": msg}
+                    f"Recruited {name} to Employee Pile.", "recruit_train"
                 )
+                msg = f"Recruited: {name}"
+        else:
+            self.state.log(
+                f"{name} not available (player has it). Skipping.",
+                "recruit_train",
+            )
+            msg = f"{name} not available (player has it)"
 
-            # All employee checks resolved — restore phase
-            if self.state.phase_before_employee_check:
-                self.state.phase = GamePhase(self.state.phase_before_employee_check)
-                self.state.phase_before_employee_check = None
+        # If more employee checks pending, prompt next one
+        if self.state.pending_employee_checks:
+            return self._prompt_pending_employee_checks(
+                {"status": "ok", "message": msg}
+            )
 
-            # Check for pending milestones that may have queued during recruit_train
-            return self._prompt_pending_milestones({"status": "ok", "message": msg})
+        # All employee checks resolved — restore phase
+        if self.state.phase_before_employee_check:
+            self.state.phase = _PHASE_BY_VALUE[self.state.phase_before_employee_check]
+            self.state.phase_before_employee_check = None
 
-        return {"status": "error", "message": f"Unknown input type: {input_type}"}
+        # Check for pending milestones that may have queued during recruit_train
+        return self._prompt_pending_milestones({"status": "ok", "message": msg})
 
     # ─── First turn ──────────────────────────────────────────────────────
 
     def _do_first_turn(self) -> dict:
         """Handle the Chain's first turn: draw top card, show it, place first restaurant."""
-        self.state.log("=== THE CHAIN'S FIRST TURN ===", "phase")
-        self.state.log("The Chain is first in turn order.", "setup")
+        st = self.state
+        st.log("=== THE CHAIN'S FIRST TURN ===", "phase")
+        st.log("The Chain is first in turn order.", "setup")
 
         # Draw the top card so the player can see the expand_chain tile
-        top_card = self.state.action_deck.peek()
+        top_card = st.action_deck.peek()
         if top_card:
-            card_data = top_card.to_dict()
-            self.state.current_front_card = card_data
+            card_data = top_card.as_dict
+            st.current_front_card = card_data
             map_tile = card_data.get("map_tiles", {}).get("expand_chain", 1)
-            self.state.log(
+            st.log(
                 f"First card revealed: #{top_card.card_number}. "
                 f"Use expand_chain tile {map_tile} for placement.",
                 "setup",
@@ -718,7 +1001,7 @@ class GameEngine:
             card_data = None
             map_tile = 1
 
-        self.state.pending_input = {
+        st.pending_input = {
             "type": "first_restaurant_placed",
             "prompt": f"Place The Chain's first restaurant. Target map tile: {map_tile}",
             "prompt_es": f"Coloca el primer restaurante de La Cadena. Casilla objetivo: {map_tile}",
@@ -734,68 +1017,71 @@ class GameEngine:
                 },
             ],
         }
-        self.state.phase = GamePhase.WAITING_FOR_INPUT
+        st.phase = GamePhase.WAITING_FOR_INPUT
         return {
             "status": "waiting",
             "message": "Place The Chain's first restaurant.",
-            "input_needed": self.state.pending_input,
+            "input_needed": st.pending_input,
         }
 
     # ─── Restructuring ───────────────────────────────────────────────────
 
     def _do_restructuring(self) -> dict:
         """RESTRUCTURING phase: flip card, competition adjustment, resolve competition card."""
-        self.state.log(
-            f"=== TURN {self.state.turn_number} — RESTRUCTURING ===", "phase"
+        st = self.state
+        deck = st.action_deck
+        discard = st.discard_pile
+        st.log(
+            f"=== TURN {st.turn_number} — RESTRUCTURING ===", "phase"
         )
 
         # Reset per-turn flags
-        self.state.bonus_cash_multiplier = 1.0
-        self.state.no_driveins_this_turn = False
-        self.state.chain_cash_this_turn = 0
-        self.state.current_competition_card = None
-        self.state.inventory.reset_delta()
+        st.bonus_cash_multiplier = 1.0
+        st.no_driveins_this_turn = False
+        st.chain_cash_this_turn = 0
+        st.current_competition_card = None
+        st.inventory.reset_delta()
 
         # STEP 1: Flip top card to reveal back side + front side of next card
-        top_card = self.state.action_deck.draw()
+        top_card = deck.draw()
         if top_card is None:
-            self.state.log("Action deck is empty!", "error")
+            st.log("Action deck is empty!", "error")
             return {"status": "error", "message": "Action deck is empty!"}
 
         # The flipped card's BACK is the current GET FOOD/CLEANUP card
-        self.state.current_back_card = top_card.to_dict()
+        st.current_back_card = top_card.as_dict
 
         # The NEXT card on top is the FRONT (RECRUIT & TRAIN) card
-        next_card = self.state.action_deck.peek()
+        next_card = deck.peek()
         if next_card:
-            self.state.current_front_card = next_card.to_dict()
+            st.current_front_card = next_card.as_dict
         else:
-            self.state.current_front_card = None
+            st.current_front_card = None
 
         # Place the flipped card into the discard pile
-        self.state.discard_pile.place_under(top_card)
+        discard.place_under(top_card)
 
         # Update deck progress counters
-        self.state.total_cards_drawn += 1
-        self.state.cards_drawn_this_cycle += 1
+        st.total_cards_drawn += 1
+        st.cards_drawn_this_cycle += 1
 
         # If action deck is now empty, reshuffle discard pile back in
-        if self.state.action_deck.is_empty() and not self.state.discard_pile.is_empty():
-            self.state.reshuffle_deck()
-            self.state.log(
+        if deck.is_empty() and not discard.is_empty():
+            st.reshuffle_deck(self._rng)
+            st.log(
                 "Action deck empty — reshuffled discard pile back in!", "restructuring"
             )
             # Update front card after reshuffle
-            next_card = self.state.action_deck.peek()
+            next_card = deck.peek()
             if next_card:
-                self.state.current_front_card = next_card.to_dict()
+                st.current_front_card = next_card.as_dict
 
-        self.state.log(
+        st.log(
             f"Flipped card #{top_card.card_number} (back side: GET FOOD & DRINKS / CLEANUP).",
             "restructuring",
         )
         if next_card:
-            self.state.log(
+            st.log(
                 f"Next card revealed: #{next_card.card_number} (front side: RECRUIT & TRAIN).",
                 "restructuring",
             )
@@ -806,71 +1092,71 @@ class GameEngine:
         # STEP 3: Resolve only the first competition card on top (if any).
         # Any further stacked competition cards are queued so the player
         # sees and acknowledges each one individually.
-        top_after = self.state.action_deck.peek()
-        if top_after and top_after.card_type in (CardType.WARM, CardType.COOL):
+        top_after = deck.peek_if(_COMPETITION_CARD_TYPES)
+        if top_after:
             resolved_msg = self._check_resolve_competition(top_after)
             if resolved_msg:
                 result_msgs.append(resolved_msg)
             # If there is still another competition card on top, queue it
-            next_top = self.state.action_deck.peek()
-            if next_top and next_top.card_type in (CardType.WARM, CardType.COOL):
-                self.state.pending_competition_actions.insert(
-                    0, {"action": "check_stacked_competition"}
+            if deck.peek_if(_COMPETITION_CARD_TYPES):
+                st.pending_competition_actions.appendleft(
+                    PendingCompetitionAction("check_stacked_competition")
                 )
 
         # Update the front card to whatever is now on top
         # (may still be a competition card if one was just queued)
-        final_top = self.state.action_deck.peek()
+        final_top = deck.peek()
         if final_top:
-            self.state.current_front_card = final_top.to_dict()
+            st.current_front_card = final_top.as_dict
 
         # Turn 1: skip Order of Business — Chain is first automatically
-        is_first_turn = self.state.turn_number == 1
+        is_first_turn = st.turn_number == 1
         next_after_restructuring = (
-            "recruit_train" if is_first_turn else "order_of_business"
+            GamePhase.RECRUIT_TRAIN if is_first_turn else GamePhase.ORDER_OF_BUSINESS
         )
 
         # Check if any competition card effects need user interaction
-        if self.state.pending_competition_actions:
-            self.state.phase_after_competition = next_after_restructuring
+        if st.pending_competition_actions:
+            st.phase_after_competition = next_after_restructuring
             restructuring_msg = "Restructuring complete. " + " ".join(result_msgs)
             first_action = self._process_pending_competition_actions()
             if first_action:
                 first_action["phase_message"] = restructuring_msg
-                first_action["current_back_card"] = self.state.current_back_card
-                first_action["current_front_card"] = self.state.current_front_card
+                first_action["current_back_card"] = st.current_back_card
+                first_action["current_front_card"] = st.current_front_card
                 return first_action
 
         if is_first_turn:
-            self.state.turn_order = "chain_first"
-            self.state.log(
+            st.turn_order = "chain_first"
+            st.log(
                 "Turn 1: The Chain is first in turn order. Order of Business skipped.",
                 "order_of_business",
             )
-            self.state.phase = GamePhase.RECRUIT_TRAIN
+            st.phase = GamePhase.RECRUIT_TRAIN
             return {
                 "status": "ok",
                 "message": "Restructuring complete. "
                 + " ".join(result_msgs)
                 + " Turn 1: Chain goes first (Order of Business skipped).",
                 "next_phase": "recruit_train",
-                "current_back_card": self.state.current_back_card,
-                "current_front_card": self.state.current_front_card,
+                "current_back_card": st.current_back_card,
+                "current_front_card": st.current_front_card,
             }
 
-        self.state.phase = GamePhase.ORDER_OF_BUSINESS
+        st.phase = GamePhase.ORDER_OF_BUSINESS
         return {
             "status": "ok",
             "message": "Restructuring complete. " + " ".join(result_msgs),
             "next_phase": "order_of_business",
-            "current_back_card": self.state.current_back_card,
-            "current_front_card": self.state.current_front_card,
+            "current_back_card": st.current_back_card,
+            "current_front_card": st.current_front_card,
         }
 
     # ─── Order of Business ──────────────────────────────────────────────
 
     # Movie star rank priority: B > C > D
     MOVIE_STAR_RANKS = ["B", "C", "D"]
+    MOVIE_STAR_RANK_MAP = {rank: i for i, rank in enumerate(MOVIE_STAR_RANKS)}
 
     def _do_order_of_business(self) -> dict:
         """ORDER OF BUSINESS phase: determine turn order.
@@ -883,45 +1169,21 @@ class GameEngine:
         self.state.current_competition_card = None
         self.state.log(f"=== ORDER OF BUSINESS ===", "phase")
 
-        chain_slots = self.state.tracks.get_open_slots()
+        chain_slots = self.state.tracks.open_slots
         chain_star = self.state.chain_movie_star
 
         # Build prompt fields
-        fields = [
-            {
-                "name": "player_open_slots",
-                "label": f"How many open (unoccupied) slots do you have in your org chart? (The Chain has {chain_slots})",
-                "label_es": f"¿Cuántas casillas abiertas (sin ocupar) tienes en tu organigrama? (La Cadena tiene {chain_slots})",
-                "type": "number",
-                "min": 0,
-                "max": 50,
-                "default": 0,
-            },
-        ]
+        fields = [_oob_open_slots_field(chain_slots)]
 
         # If movie stars module enabled, ask about player's movie star
         if self.state.modules.get("movie_stars"):
-            star_info = (
-                f" The Chain has: {chain_star}-movie star."
-                if chain_star
-                else " The Chain has no movie star."
-            )
-            fields.append(
-                {
-                    "name": "player_movie_star",
-                    "label": f"Do you have a movie star?{star_info}",
-                    "label_es": f"¿Tienes una estrella de cine?{star_info}",
-                    "type": "select",
-                    "options": ["none", "B", "C", "D"],
-                }
-            )
+            fields.append(_oob_movie_star_field(chain_star))
 
+        prompt, prompt_es = _oob_prompts(chain_slots, chain_star)
         self.state.pending_input = {
             "type": "order_of_business",
-            "prompt": f"Order of Business — Determine turn order. The Chain has {chain_slots} open slot(s)."
-            + (f" Movie star: {chain_star}." if chain_star else ""),
-            "prompt_es": f"Orden de juego — Determinar orden de turno. La Cadena tiene {chain_slots} casilla(s) abierta(s)."
-            + (f" Estrella de cine: {chain_star}." if chain_star else ""),
+            "prompt": prompt,
+            "prompt_es": prompt_es,
             "fields": fields,
         }
         self.state.phase = GamePhase.WAITING_FOR_INPUT
@@ -934,7 +1196,7 @@ class GameEngine:
     def _resolve_order_of_business(self, input_data: dict) -> dict:
         """Process player input for Order of Business and determine turn order."""
         self.state.pending_input = None
-        chain_slots = self.state.tracks.get_open_slots()
+        chain_slots = self.state.tracks.open_slots
         player_slots = int(input_data.get("player_open_slots", 0))
 
         # Determine who goes first
@@ -953,16 +1215,8 @@ class GameEngine:
                 if player_star == "none":
                     player_star = None
 
-                chain_rank = (
-                    self.MOVIE_STAR_RANKS.index(chain_star)
-                    if chain_star in self.MOVIE_STAR_RANKS
-                    else 99
-                )
-                player_rank = (
-                    self.MOVIE_STAR_RANKS.index(player_star)
-                    if player_star in self.MOVIE_STAR_RANKS
-                    else 99
-                )
+                chain_rank = self.MOVIE_STAR_RANK_MAP.get(chain_star, 99)
+                player_rank = self.MOVIE_STAR_RANK_MAP.get(player_star, 99)
 
                 if chain_rank < player_rank:
                     goes_first = "chain_first"
@@ -1001,95 +1255,77 @@ class GameEngine:
             "next_phase": "recruit_train",
         }
 
+    # Competition level -> (source deck attribute, deck label, level the
+    # marker eases to after placing on top + under; None = one card under)
+    _COMP_PLAN = {
+        CompetitionLevel.HOT: ("warm_deck", "Warm", CompetitionLevel.WARM),
+        CompetitionLevel.WARM: ("warm_deck", "Warm", None),
+        CompetitionLevel.COOL: ("cool_deck", "Cool", None),
+        CompetitionLevel.COLD: ("cool_deck", "Cool", CompetitionLevel.COOL),
+    }
+
     def _competition_adjustment(self) -> list[str]:
         """Step 2 of Restructuring: adjust based on competition track."""
         msgs = []
         level = self.state.tracks.competition
 
-        if level == CompetitionLevel.HOT:
-            # Place WARM on top AND under
-            card1 = self.state.warm_deck.draw()
-            card2 = self.state.warm_deck.draw()
-            if card1:
-                self.state.action_deck.place_on_top(card1)
-                msgs.append(f"HOT: Warm card placed on top of Action Deck.")
-            else:
-                self.state.log(
-                    "Warm deck exhausted — cannot place card on top.", "warning"
-                )
-                msgs.append("HOT: Warm deck empty — no card placed on top.")
-            if card2:
-                self.state.action_deck.place_under(card2)
-                msgs.append(f"Warm card placed under Action Deck.")
-            else:
-                self.state.log(
-                    "Warm deck exhausted — cannot place card under.", "warning"
-                )
-                msgs.append("Warm deck empty — no card placed under.")
-            # Move marker down to WARM
-            self.state.tracks.competition = CompetitionLevel.WARM
-            msgs.append(f"Competition moved to WARM.")
-            self.state.log(
-                "Competition HOT → placed Warm card on top + under. Moved to WARM.",
-                "restructuring",
-            )
-
-        elif level == CompetitionLevel.WARM or self.state.optional_rules.get(
+        # Optional rule: every level below HOT behaves like WARM
+        if level != CompetitionLevel.HOT and self.state.optional_rules.get(
             "aggressive_restructuring"
         ):
-            card = self.state.warm_deck.draw()
-            if card:
-                self.state.action_deck.place_under(card)
-                msgs.append("WARM: Warm card placed under Action Deck.")
-                self.state.log(
-                    "Competition WARM → placed Warm card under deck.", "restructuring"
-                )
-            else:
-                self.state.log("Warm deck exhausted — no card to place.", "warning")
-                msgs.append("WARM: Warm deck empty — no card placed.")
+            level = CompetitionLevel.WARM
 
-        elif level == CompetitionLevel.NEUTRAL:
+        if level == CompetitionLevel.NEUTRAL:
             msgs.append("NEUTRAL: No competition adjustment.")
             self.state.log("Competition NEUTRAL → no adjustment.", "restructuring")
+            return msgs
+
+        deck_attr, label, next_level = self._COMP_PLAN[level]
+        deck = getattr(self.state, deck_attr)
+        action_deck = self.state.action_deck
+        name = level.name
 
-        elif level == CompetitionLevel.COOL:
-            card = self.state.cool_deck.draw()
+        if next_level is None:
+            # WARM / COOL: one card under the Action Deck
+            card = deck.draw()
             if card:
-                self.state.action_deck.place_under(card)
-                msgs.append("COOL: Cool card placed under Action Deck.")
-                self.state.log(
-                    "Competition COOL → placed Cool card under deck.", "restructuring"
-                )
-            else:
-                self.state.log("Cool deck exhausted — no card to place.", "warning")
-                msgs.append("COOL: Cool deck empty — no card placed.")
-
-        elif level == CompetitionLevel.COLD:
-            card1 = self.state.cool_deck.draw()
-            card2 = self.state.cool_deck.draw()
-            if card1:
-                self.state.action_deck.place_on_top(card1)
-                msgs.append("COLD: Cool card placed on top of Action Deck.")
-            else:
+                action_deck.place_under(card)
+                msgs.append(f"{name}: {label} card placed under Action Deck.")
                 self.state.log(
-                    "Cool deck exhausted — cannot place card on top.", "warning"
+                    f"Competition {name} → placed {label} card under deck.",
+                    "restructuring",
                 )
-                msgs.append("COLD: Cool deck empty — no card placed on top.")
-            if card2:
-                self.state.action_deck.place_under(card2)
-                msgs.append("Cool card placed under Action Deck.")
             else:
-                self.state.log(
-                    "Cool deck exhausted — cannot place card under.", "warning"
-                )
-                msgs.append("Cool deck empty — no card placed under.")
-            self.state.tracks.competition = CompetitionLevel.COOL
-            msgs.append("Competition moved to COOL.")
+                self.state.log(f"{label} deck exhausted — no card to place.", "warning")
+                msgs.append(f"{name}: {label} deck empty — no card placed.")
+            return msgs
+
+        # HOT / COLD: one card on top and one under, then ease the marker
+        card1 = deck.draw()
+        card2 = deck.draw()
+        if card1:
+            action_deck.place_on_top(card1)
+            msgs.append(f"{name}: {label} card placed on top of Action Deck.")
+        else:
             self.state.log(
-                "Competition COLD → placed Cool card on top + under. Moved to COOL.",
-                "restructuring",
+                f"{label} deck exhausted — cannot place card on top.", "warning"
             )
-
+            msgs.append(f"{name}: {label} deck empty — no card placed on top.")
+        if card2:
+            action_deck.place_under(card2)
+            msgs.append(f"{label} card placed under Action Deck.")
+        else:
+            self.state.log(
+                f"{label} deck exhausted — cannot place card under.", "warning"
+            )
+            msgs.append(f"{label} deck empty — no card placed under.")
+        self.state.tracks.competition = next_level
+        msgs.append(f"Competition moved to {next_level.name}.")
+        self.state.log(
+            f"Competition {name} → placed {label} card on top + under. "
+            f"Moved to {next_level.name}.",
+            "restructuring",
+        )
         return msgs
 
     def _check_resolve_competition(self, card: Card) -> Optional[str]:
@@ -1143,6 +1379,14 @@ class GameEngine:
             )
             return f"Competition card not resolved (track is {level.label()})."
 
+    # Track adjustment type -> (Tracks attribute, message label, log label,
+    # re-check track milestones afterwards)
+    _TA_DISPATCH = {
+        "move_distance": ("price_distance", "Distance", "Price+Distance", True),
+        "move_waitress": ("waitresses", "Waitress", "Waitresses", False),
+        "move_recruit_train": ("recruit_train", "R&T", "Recruit & Train", True),
+    }
+
     def _resolve_competition_card(self, card: Card) -> str:
         """Resolve a competition card's effect.
 
@@ -1160,16 +1404,15 @@ class GameEngine:
 
         effect = card.competition_effect
         msgs = []
-        food_amount = self.state.tracks.get_food_amount()
+        food_amount = self.state.tracks.food_amount
 
         # ── Step 1: Type-specific effects (always first) ──────────────
         if effect.effect_type == "expand_chain":
             if len(self.state.restaurants) < self.state.max_restaurants:
                 self.state.pending_competition_actions.append(
-                    {
-                        "action": "competition_expand_chain",
-                        "map_tile": effect.map_tile,
-                    }
+                    PendingCompetitionAction(
+                        "competition_expand_chain", map_tile=effect.map_tile
+                    )
                 )
                 msgs.append(
                     f"EXPAND CHAIN → will ask to place restaurant (tile {effect.map_tile})"
@@ -1182,10 +1425,9 @@ class GameEngine:
                 msgs.append("COFFEE SHOP → place a coffee shop if available.")
             elif len(self.state.restaurants) < self.state.max_restaurants:
                 self.state.pending_competition_actions.append(
-                    {
-                        "action": "competition_expand_chain",
-                        "map_tile": effect.map_tile,
-                    }
+                    PendingCompetitionAction(
+                        "competition_expand_chain", map_tile=effect.map_tile
+                    )
                 )
                 msgs.append(
                     "EXPAND CHAIN → will ask to place restaurant (coffee not in play)."
@@ -1201,8 +1443,8 @@ class GameEngine:
 
         elif effect.effect_type == "fire_employees":
             # Fire all employees from pile (marketeers with active campaigns stay)
-            fired = list(self.state.employee_pile)
-            self.state.employee_pile.clear()
+            fired = self.state.employee_pile
+            self.state.employee_pile = []
             msgs.append(
                 f"FIRE ALL EMPLOYEES: {', '.join(fired) if fired else 'none to fire'}."
             )
@@ -1227,39 +1469,37 @@ class GameEngine:
             )
 
         # ── Step 2: Food adjustments (warm cards) ─────────────────────
-        for adj in effect.food_adjustments:
-            item = adj["item"]
-            multiplier = adj.get("amount", 1)
-            module = adj.get("module")
-            fallback = adj.get("fallback")
-
-            if item in ("all_demand", "most_demand"):
-                self.state.pending_competition_actions.append(
-                    {
-                        "action": "competition_demand_info",
-                        "demand_type": item,
-                        "multiplier": multiplier,
-                        "food_amount": food_amount,
-                    }
-                )
-                msgs.append(
-                    f"{item.replace('_', ' ').title()}: will ask for demand info"
+        enabled = self.state.enabled_modules
+        for demand_type, multiplier in effect.demand_adjustments:
+            self.state.pending_competition_actions.append(
+                PendingCompetitionAction(
+                    "competition_demand_info",
+                    demand_type=demand_type,
+                    multiplier=multiplier,
+                    food_amount=food_amount,
                 )
-            else:
-                actual_amount = food_amount * multiplier
-                if module and not self.state.modules.get(module, False):
-                    if fallback:
-                        self.state.inventory.add(fallback, actual_amount)
-                        msgs.append(
-                            f"+{actual_amount} {fallback} (fallback, {module} not in play)"
-                        )
-                    else:
-                        msgs.append(f"Skipped {item} ({module} not in play)")
-                elif not _is_item_available(item, self.state.modules):
-                    msgs.append(f"Skipped {item} (module not in play)")
+            )
+            msgs.append(f"{_DEMAND_LABELS[demand_type]}: will ask for demand info")
+
+        food_adds = []
+        for item, multiplier, module, fallback in effect.item_adjustments:
+            actual_amount = food_amount * multiplier
+            if module and not self.state.modules.get(module, False):
+                if fallback:
+                    food_adds.append((fallback, actual_amount))
+                    msgs.append(
+                        f"+{actual_amount} {fallback} (fallback, {module} not in play)"
+                    )
                 else:
-                    self.state.inventory.add(item, actual_amount)
-                    msgs.append(f"+{actual_amount} {item}")
+                    msgs.append(f"Skipped {item} ({module} not in play)")
+            elif not _is_item_available(item, enabled):
+                msgs.append(f"Skipped {item} (module not in play)")
+            else:
+                food_adds.append((item, actual_amount))
+                msgs.append(f"+{actual_amount} {item}")
+
+        if food_adds:
+            self.state.inventory.bulk_add(food_adds)
 
         # ── Step 3: Inventory drop (cool cards, before inventory loss) ─
         if effect.inventory_drop:
@@ -1270,9 +1510,12 @@ class GameEngine:
                 msgs.append("INVENTORY DROP: no items on top row.")
 
         # ── Step 4: Inventory loss (cool cards, after drop) ───────────
-        for item in effect.inventory_loss_items:
-            self.state.inventory.clear_item(item)
-            msgs.append(f"INVENTORY LOSS: all {item} removed.")
+        if effect.inventory_loss_items:
+            self.state.inventory.bulk_clear(effect.inventory_loss_items)
+            msgs.extend(
+                f"INVENTORY LOSS: all {item} removed."
+                for item in effect.inventory_loss_items
+            )
 
         # ── Step 5: Inventory boost (warm cards) ──────────────────────
         if effect.inventory_boost:
@@ -1283,45 +1526,29 @@ class GameEngine:
                 msgs.append("INVENTORY BOOST: no items on bottom row.")
 
         # ── Step 6: Track adjustments (always last) ───────────────────
+        tracks = self.state.tracks
         for ta in effect.track_adjustments:
-            ta_type = ta["type"]
-            ta_value = ta["value"]
-
-            if ta_type == "move_distance":
-                old, new, _ = self.state.tracks.price_distance.move(ta_value)
-                msgs.append(f"Distance: {old}→{new}")
-                self.state.log(
-                    f"Competition card: Price+Distance {old} → {new}", "competition"
-                )
+            plan = self._TA_DISPATCH.get(ta["type"])
+            if plan is None:
+                continue
+            attr, label, log_label, check_milestones = plan
+            old, new, crossed = getattr(tracks, attr).move(ta["value"])
+            msgs.append(f"{label}: {old}→{new}")
+            self.state.log(
+                f"Competition card: {log_label} {old} → {new}", "competition"
+            )
+            if check_milestones:
                 self._check_track_milestones()
-            elif ta_type == "move_waitress":
-                old, new, _ = self.state.tracks.waitresses.move(ta_value)
-                msgs.append(f"Waitress: {old}→{new}")
-                self.state.log(
-                    f"Competition card: Waitresses {old} → {new}", "competition"
+            # Only the Recruit & Train marker can cross the shuffle boundary
+            if crossed:
+                # Never leave a competition card on top after the shuffle
+                self.state.reshuffle_deck(
+                    self._rng, keep_off_top=_COMPETITION_CARD_TYPES
                 )
-            elif ta_type == "move_recruit_train":
-                old, new, crossed = self.state.tracks.recruit_train.move(ta_value)
-                msgs.append(f"R&T: {old}→{new}")
+                msgs.append("ACTION DECK SHUFFLED!")
                 self.state.log(
-                    f"Competition card: Recruit & Train {old} → {new}", "competition"
+                    "SHUFFLE triggered by R&T track crossing!", "competition"
                 )
-                self._check_track_milestones()
-                if crossed:
-                    self.state.reshuffle_deck()
-                    msgs.append("ACTION DECK SHUFFLED!")
-                    self.state.log(
-                        "SHUFFLE triggered by R&T track crossing!", "competition"
-                    )
-                    # Ensure no competition card on top after shuffle
-                    top = self.state.action_deck.peek()
-                    while top and top.card_type in (CardType.WARM, CardType.COOL):
-                        self.state.reshuffle_deck()
-                        self.state.log(
-                            "Competition card on top after shuffle — reshuffling.",
-                            "competition",
-                        )
-                        top = self.state.action_deck.peek()
 
         result = " | ".join(msgs)
         self.state.log(
@@ -1336,136 +1563,130 @@ class GameEngine:
         Returns a 'waiting' result dict if user interaction is needed,
         or None if the queue is empty (caller should continue normal flow).
         """
-        if not self.state.pending_competition_actions:
-            return None
-
-        action = self.state.pending_competition_actions.pop(0)
-        action_type = action.get("action", "")
-
-        if action_type == "competition_expand_chain":
-            map_tile = action.get("map_tile", 1)
-            self.state.pending_input = {
-                "type": "competition_restaurant_placed",
-                "prompt": (
-                    f"🏗️ Competition card: EXPAND CHAIN!\n"
-                    f"Place a new restaurant. Target map tile: {map_tile}"
-                ),
-                "prompt_es": (
-                    f"🏗️ Carta de competencia: ¡EXPANDIR CADENA!\n"
-                    f"Coloca un nuevo restaurante. Casilla objetivo: {map_tile}"
-                ),
-                "fields": [
-                    {
-                        "name": "tile",
-                        "label": "Map tile placed on",
-                        "label_es": "Casilla donde se coloca",
-                        "type": "number",
-                        "min": 1,
-                        "max": 9,
-                        "default": map_tile,
-                    }
-                ],
-            }
-            self.state.phase = GamePhase.WAITING_FOR_INPUT
-            return {
-                "status": "waiting",
-                "message": f"Competition card: Place restaurant on tile {map_tile}.",
-                "input_needed": self.state.pending_input,
-            }
+        queue = self.state.pending_competition_actions
+        while queue:
+            action = queue.popleft()
+            action_type = action.action
 
-        elif action_type == "competition_demand_info":
-            demand_type = action.get("demand_type", "most_demand")
-            multiplier = action.get("multiplier", 1)
-            food_amount = action.get("food_amount", 2)
-
-            fields = [
-                {
-                    "name": "items_with_demand",
-                    "label": "Items with demand on map",
-                    "label_es": "Items con demanda en el mapa",
-                    "type": "multiselect",
-                    "options": [
-                        fi.value
-                        for fi in FoodItem
-                        if _is_item_available(fi.value, self.state.modules)
+            if action_type == "competition_expand_chain":
+                map_tile = action.map_tile
+                self.state.pending_input = {
+                    "type": "competition_restaurant_placed",
+                    "prompt": (
+                        f"🏗️ Competition card: EXPAND CHAIN!\n"
+                        f"Place a new restaurant. Target map tile: {map_tile}"
+                    ),
+                    "prompt_es": (
+                        f"🏗️ Carta de competencia: ¡EXPANDIR CADENA!\n"
+                        f"Coloca un nuevo restaurante. Casilla objetivo: {map_tile}"
+                    ),
+                    "fields": [
+                        {
+                            "name": "tile",
+                            "label": "Map tile placed on",
+                            "label_es": "Casilla donde se coloca",
+                            "type": "number",
+                            "min": 1,
+                            "max": 9,
+                            "default": map_tile,
+                        }
                     ],
-                },
-            ]
+                }
+                self.state.phase = GamePhase.WAITING_FOR_INPUT
+                return {
+                    "status": "waiting",
+                    "message": f"Competition card: Place restaurant on tile {map_tile}.",
+                    "input_needed": self.state.pending_input,
+                }
+
+            elif action_type == "competition_demand_info":
+                demand_type = action.demand_type
+                multiplier = action.multiplier
+                food_amount = action.food_amount
+                enabled = self.state.enabled_modules
+                food_options = list(_available_food_items(enabled))
 
-            if demand_type == "most_demand":
-                fields.append(
+                fields = [
                     {
-                        "name": "most_demand_items",
-                        "label": "Item(s) with MOST demand tokens (select all tied items)",
-                        "label_es": "Item(s) con MÁS fichas de demanda (selecciona todos los empatados)",
+                        "name": "items_with_demand",
+                        "label": "Items with demand on map",
+                        "label_es": "Items con demanda en el mapa",
                         "type": "multiselect",
-                        "options": [
-                            fi.value
-                            for fi in FoodItem
-                            if _is_item_available(fi.value, self.state.modules)
-                        ],
-                    }
-                )
+                        "options": food_options,
+                    },
+                ]
 
-            self.state.pending_input = {
-                "type": "competition_demand_info",
-                "prompt": (
-                    f"🍔 Competition card: Get food ({demand_type.replace('_', ' ')})!\n"
-                    f"Which food items have demand tokens on the map?"
-                ),
-                "prompt_es": (
-                    f"🍔 Carta de competencia: ¡Obtener comida ({demand_type.replace('_', ' ')})!\n"
-                    f"¿Qué items de comida tienen fichas de demanda en el mapa?"
-                ),
-                "demand_type": demand_type,
-                "multiplier": multiplier,
-                "food_amount": food_amount,
-                "fields": fields,
-            }
-            self.state.phase = GamePhase.WAITING_FOR_INPUT
-            return {
-                "status": "waiting",
-                "message": f"Competition card: Need demand info ({demand_type.replace('_', ' ')}).",
-                "input_needed": self.state.pending_input,
-            }
+                if demand_type == "most_demand":
+                    fields.append(
+                        {
+                            "name": "most_demand_items",
+                            "label": "Item(s) with MOST demand tokens (select all tied items)",
+                            "label_es": "Item(s) con MÁS fichas de demanda (selecciona todos los empatados)",
+                            "type": "multiselect",
+                            "options": food_options,
+                        }
+                    )
 
-        elif action_type == "check_stacked_competition":
-            top = self.state.action_deck.peek()
-            if not top or top.card_type not in (CardType.WARM, CardType.COOL):
-                # No longer a competition card (e.g. after a shuffle) — skip
-                return self._process_pending_competition_actions()
-            # Show the card to the player before resolving it
-            comp_card_data = top.to_dict()
-            comp_card_data["resolved"] = False
-            comp_card_data["competition_level"] = self.state.tracks.competition.label()
-            self.state.current_competition_card = comp_card_data
-            self.state.current_front_card = comp_card_data
-            card_label = top.card_type.value.title()
-            self.state.pending_input = {
-                "type": "acknowledge_competition_card",
-                "prompt": (
-                    f"⚠️ Another {card_label} competition card (#{top.card_number}) "
-                    f"was stacked on top of the deck! Press Confirm to resolve it."
-                ),
-                "prompt_es": (
-                    f"⚠️ ¡Había otra carta de competencia {card_label} "
-                    f"(#{top.card_number}) apilada! Confirma para resolverla."
-                ),
-                "fields": [],
-            }
-            self.state.phase = GamePhase.WAITING_FOR_INPUT
-            return {
-                "status": "waiting",
-                "message": (
-                    f"Stacked {card_label} competition card #{top.card_number} "
-                    f"revealed on top of the deck. Confirm to resolve it."
-                ),
-                "input_needed": self.state.pending_input,
-            }
+                self.state.pending_input = {
+                    "type": "competition_demand_info",
+                    "prompt": (
+                        f"🍔 Competition card: Get food ({demand_type.replace('_', ' ')})!\n"
+                        f"Which food items have demand tokens on the map?"
+                    ),
+                    "prompt_es": (
+                        f"🍔 Carta de competencia: ¡Obtener comida ({demand_type.replace('_', ' ')})!\n"
+                        f"¿Qué items de comida tienen fichas de demanda en el mapa?"
+                    ),
+                    "demand_type": demand_type,
+                    "multiplier": multiplier,
+                    "food_amount": food_amount,
+                    "fields": fields,
+                }
+                self.state.phase = GamePhase.WAITING_FOR_INPUT
+                return {
+                    "status": "waiting",
+                    "message": f"Competition card: Need demand info ({demand_type.replace('_', ' ')}).",
+                    "input_needed": self.state.pending_input,
+                }
+
+            elif action_type == "check_stacked_competition":
+                top = self.state.action_deck.peek_if(_COMPETITION_CARD_TYPES)
+                if not top:
+                    # No longer a competition card (e.g. after a shuffle) — skip
+                    continue
+                # Show the card to the player before resolving it
+                comp_card_data = top.to_dict()
+                comp_card_data["resolved"] = False
+                comp_card_data["competition_level"] = self.state.tracks.competition.label()
+                self.state.current_competition_card = comp_card_data
+                self.state.current_front_card = comp_card_data
+                card_label = top.card_type.value.title()
+                self.state.pending_input = {
+                    "type": "acknowledge_competition_card",
+                    "prompt": (
+                        f"⚠️ Another {card_label} competition card (#{top.card_number}) "
+                        f"was stacked on top of the deck! Press Confirm to resolve it."
+                    ),
+                    "prompt_es": (
+                        f"⚠️ ¡Había otra carta de competencia {card_label} "
+                        f"(#{top.card_number}) apilada! Confirma para resolverla."
+                    ),
+                    "fields": [],
+                }
+                self.state.phase = GamePhase.WAITING_FOR_INPUT
+                return {
+                    "status": "waiting",
+                    "message": (
+                        f"Stacked {card_label} competition card #{top.card_number} "
+                        f"revealed on top of the deck. Confirm to resolve it."
+                    ),
+                    "input_needed": self.state.pending_input,
+                }
+
+            # Unknown action type — skip it
+            self.state.log(f"Unknown competition action: {action_type}", "warning")
 
-        # Unknown action type — skip it
-        self.state.log(f"Unknown competition action: {action_type}", "warning")
-        return self._process_pending_competition_actions()
+        return None
 
     def _resume_after_competition(self) -> dict:
         """Check for more pending competition actions, or resume normal phase flow."""
@@ -1476,14 +1697,14 @@ class GameEngine:
 
         # All competition actions done — restore phase flow
         self.state.current_competition_card = None
-        resume_phase = self.state.phase_after_competition or "order_of_business"
+        resume_phase = self.state.phase_after_competition or GamePhase.ORDER_OF_BUSINESS
         self.state.phase_after_competition = None
-        self.state.phase = GamePhase(resume_phase)
+        self.state.phase = resume_phase
 
         return {
             "status": "ok",
             "message": "Competition card effects resolved. Continuing...",
-            "next_phase": resume_phase,
+            "next_phase": resume_phase.value,
         }
 
     def _resolve_competition_demand(self, input_data: dict) -> dict:
@@ -1493,7 +1714,7 @@ class GameEngine:
             "demand_type", "most_demand"
         )
         multiplier = pending.get("multiplier", 1)
-        food_amount = pending.get("food_amount", self.state.tracks.get_food_amount())
+        food_amount = pending.get("food_amount", self.state.tracks.food_amount)
 
         items_with_demand = input_data.get("items_with_demand", [])
         most_demand_items = input_data.get("most_demand_items", [])
@@ -1508,13 +1729,12 @@ class GameEngine:
 
         added = []
         if demand_type == "all_demand":
+            amount = food_amount * multiplier
+            self.state.inventory.bulk_add((item, amount) for item in items_with_demand)
+            log = self.state.log
             for item in items_with_demand:
-                amount = food_amount * multiplier
-                self.state.inventory.add(item, amount)
                 added.append(f"+{amount} {item}")
-                self.state.log(
-                    f"Competition all demand: +{amount} {item}", "competition"
-                )
+                log(f"Competition all demand: +{amount} {item}", "competition")
         elif demand_type == "most_demand":
             if len(most_demand_items) == 1:
                 item = most_demand_items[0]
@@ -1526,10 +1746,11 @@ class GameEngine:
                 )
             elif len(most_demand_items) > 1:
                 # Tie — ask for house demand to break it
+                tied = ", ".join(most_demand_items)
                 self.state.pending_input = {
                     "type": "competition_demand_tiebreak",
-                    "prompt": f"Tie between {', '.join(most_demand_items)}! How many demand tokens on HOUSES for each?",
-                    "prompt_es": f"¡Empate entre {', '.join(most_demand_items)}! ¿Cuántas fichas de demanda en CASAS para cada uno?",
+                    "prompt": f"Tie between {tied}! How many demand tokens on HOUSES for each?",
+                    "prompt_es": f"¡Empate entre {tied}! ¿Cuántas fichas de demanda en CASAS para cada uno?",
                     "tied_items": most_demand_items,
                     "multiplier": multiplier,
                     "food_amount": food_amount,
@@ -1538,10 +1759,7 @@ class GameEngine:
                             "name": f"house_demand_{item}",
                             "label": f"Demand on houses: {item}",
                             "label_es": f"Demanda en casas: {item}",
-                            "type": "number",
-                            "min": 0,
-                            "max": 50,
-                            "default": 0,
+                            **_HOUSE_DEMAND_FIELD,
                         }
                         for item in most_demand_items
                     ],
@@ -1549,7 +1767,7 @@ class GameEngine:
                 self.state.phase = GamePhase.WAITING_FOR_INPUT
                 return {
                     "status": "waiting",
-                    "message": f"Competition card: Tie for most demand between {', '.join(most_demand_items)}.",
+                    "message": f"Competition card: Tie for most demand between {tied}.",
                     "input_needed": self.state.pending_input,
                 }
             else:
@@ -1566,14 +1784,9 @@ class GameEngine:
         pending = self.state.pending_input or {}
         tied_items = pending.get("tied_items", [])
         multiplier = pending.get("multiplier", 1)
-        food_amount = pending.get("food_amount", self.state.tracks.get_food_amount())
+        food_amount = pending.get("food_amount", self.state.tracks.food_amount)
 
-        house_counts = {}
-        for item in tied_items:
-            house_counts[item] = input_data.get(f"house_demand_{item}", 0)
-
-        max_count = max(house_counts.values()) if house_counts else 0
-        winners = [item for item, count in house_counts.items() if count == max_count]
+        max_count, winners = _house_demand_leaders(tied_items, input_data)
 
         if len(winners) == 1:
             winner = winners[0]
@@ -1582,7 +1795,7 @@ class GameEngine:
                 "competition",
             )
         else:
-            winner = random.choice(winners)
+            winner = self._rng.choice(winners)
             self.state.log(
                 f"Competition tiebreak random: {winner} (still tied on houses)",
                 "competition",
@@ -1612,7 +1825,7 @@ class GameEngine:
                 "Turn 1: The Chain does not take Recruit & Train actions.",
                 "recruit_train",
             )
-            self.state.phase = GamePhase.INITIATE_MARKETING
+            self._advance()
             hint = self._worktime_turn_hint()
             return {
                 "status": "ok",
@@ -1622,7 +1835,7 @@ class GameEngine:
 
         front_card_data = self.state.current_front_card
         if not front_card_data or "front" not in front_card_data:
-            self.state.phase = GamePhase.INITIATE_MARKETING
+            self._advance()
             hint = self._worktime_turn_hint()
             return {
                 "status": "ok",
@@ -1630,7 +1843,7 @@ class GameEngine:
                 "next_phase": "initiate_marketing",
             }
 
-        open_slots = self.state.tracks.get_open_slots()
+        open_slots = self.state.tracks.open_slots
         actions = front_card_data["front"]["actions"]
 
         # Actions are listed ascending [S1, S2, S3, S4] (bottom to top on card)
@@ -1642,24 +1855,26 @@ class GameEngine:
         # Execution order is always descending (highest open slot first).
 
         active_actions = actions[:open_slots]  # Take the N lowest slots
-        # Execute in descending order (highest slot number first)
-        active_actions_reversed = list(reversed(active_actions))
 
+        # Execute in descending order (highest slot number first), collecting
+        # stars only from the active (open) slots along the way
         result_msgs = []
-        for action_data in active_actions_reversed:
-            msg = self._execute_recruit_action(action_data)
-            result_msgs.append(msg)
+        stars = []
+        for action_data in reversed(active_actions):
+            result_msgs.append(self._execute_recruit_action(action_data))
+            star = action_data.get("star")
+            if star:
+                stars.append(star)
+        stars.reverse()  # back to slot order
 
         self.state.log(
             f"Open slots: {open_slots}. Executed {len(active_actions)} actions.",
             "recruit_train",
         )
 
-        # Collect stars only from the active (open) slots
-        stars = [a["star"] for a in active_actions if a.get("star")]
         self.state.pending_stars = stars
 
-        self.state.phase = GamePhase.INITIATE_MARKETING
+        self._advance()
         hint = self._worktime_turn_hint()
         return {
             "status": "ok",
@@ -1670,6 +1885,16 @@ class GameEngine:
             "next_phase": "initiate_marketing",
         }
 
+    # Recruit & Train action type -> handler method name (called with target)
+    _RECRUIT_ACTIONS = {
+        "recruit_marketeer": "_recruit_marketeer",
+        "recruit_employee": "_recruit_employee",
+        "move_distance": "_recruit_move_distance",
+        "move_waitress": "_recruit_move_waitress",
+        "claim_milestone": "_recruit_claim_milestone",
+        "get_food": "_recruit_get_food",
+    }
+
     def _execute_recruit_action(self, action_data: dict) -> str:
         """Execute a single Recruit & Train action."""
         action_type = action_data["type"]
@@ -1680,11 +1905,10 @@ class GameEngine:
         # Check if module is required but not active
         if requires and not self.state.modules.get(requires, False):
             if fallback:
-                food_amount = self.state.tracks.get_food_amount()
-                foods = fallback if isinstance(fallback, list) else [fallback]
-                for f in foods:
+                food_amount = self.state.tracks.food_amount
+                for f in fallback:
                     self.state.inventory.add(f, food_amount)
-                names = ", ".join(foods)
+                names = ", ".join(fallback)
                 self.state.log(
                     f"Module '{requires}' not in play. Getting +{food_amount} {names} instead.",
                     "recruit_train",
@@ -1692,62 +1916,61 @@ class GameEngine:
                 return f"GET FOOD: +{food_amount} {names} (module not in play)"
             return f"Skipped (module '{requires}' not in play)"
 
-        if action_type == "recruit_marketeer":
-            return self._recruit_marketeer(target)
-        elif action_type == "recruit_employee":
-            return self._recruit_employee(target)
-        elif action_type == "move_distance":
-            delta = int(target)
-            old, new, crossed = self.state.tracks.price_distance.move(delta)
-            self.state.log(f"Price+Distance: {old} → {new}", "recruit_train")
-            self._check_track_milestones()
-            return f"Price+Distance: {old} → {new}"
-        elif action_type == "move_waitress":
-            delta = int(target)
-            old, new, _ = self.state.tracks.waitresses.move(delta)
-            self.state.log(f"Waitresses: {old} → {new}", "recruit_train")
-            if new == 4:
-                if (
-                    self.state.modules.get("movie_stars")
-                    and not self.state.chain_movie_star
-                ):
-                    # Recruit highest available movie star: B > C > D
-                    for rank in self.MOVIE_STAR_RANKS:
-                        self.state.chain_movie_star = rank
-                        self.state.log(
-                            f"Waitresses reached 4! The Chain recruits a {rank}-movie star!",
-                            "recruit_train",
-                        )
-                        break
-                else:
+        handler_name = self._RECRUIT_ACTIONS.get(action_type)
+        if handler_name is None:
+            return f"Unknown action: {action_type}"
+        return getattr(self, handler_name)(target)
+
+    def _recruit_move_distance(self, target) -> str:
+        """Move the Price+Distance marker by the card's value."""
+        old, new, _ = self.state.tracks.price_distance.move(int(target))
+        self.state.log(f"Price+Distance: {old} → {new}", "recruit_train")
+        self._check_track_milestones()
+        return f"Price+Distance: {old} → {new}"
+
+    def _recruit_move_waitress(self, target) -> str:
+        """Move the Waitresses marker; may recruit a movie star or claim a milestone."""
+        old, new, _ = self.state.tracks.waitresses.move(int(target))
+        self.state.log(f"Waitresses: {old} → {new}", "recruit_train")
+        if new == 4:
+            if (
+                self.state.modules.get("movie_stars")
+                and not self.state.chain_movie_star
+            ):
+                # Recruit highest available movie star: B > C > D
+                for rank in self.MOVIE_STAR_RANKS:
+                    self.state.chain_movie_star = rank
                     self.state.log(
-                        "Waitresses reached 4! Recruit highest-ranking movie star.",
+                        f"Waitresses reached 4! The Chain recruits a {rank}-movie star!",
                         "recruit_train",
                     )
-            # Milestone: first to have a waitress
-            if (
-                new > 0
-                and "first_to_have_waitress" not in self.state.milestones_claimed
-            ):
-                self.state.milestones_claimed.append("first_to_have_waitress")
+                    break
+            else:
                 self.state.log(
-                    "Milestone claimed: First to Have a Waitress!", "milestone"
+                    "Waitresses reached 4! Recruit highest-ranking movie star.",
+                    "recruit_train",
                 )
-            self._check_track_milestones()
-            return f"Waitresses: {old} → {new}"
-        elif action_type == "claim_milestone":
-            if target not in self.state.milestones_claimed:
-                self.state.milestones_claimed.append(target)
-                self.state.log(f"Milestone claimed: {target}!", "milestone")
-                return f"Milestone: {target}"
-            return f"Milestone {target} already claimed"
-        elif action_type == "get_food":
-            food_amount = self.state.tracks.get_food_amount()
-            self.state.inventory.add(target, food_amount)
-            self.state.log(f"Get food: +{food_amount} {target}", "recruit_train")
-            return f"GET FOOD: +{food_amount} {target}"
-
-        return f"Unknown action: {action_type}"
+        # Milestone: first to have a waitress
+        if new > 0 and "first_to_have_waitress" not in self.state.milestones_claimed:
+            self.state.milestones_claimed["first_to_have_waitress"] = None
+            self.state.log("Milestone claimed: First to Have a Waitress!", "milestone")
+        self._check_track_milestones()
+        return f"Waitresses: {old} → {new}"
+
+    def _recruit_claim_milestone(self, target: str) -> str:
+        """Claim the milestone named on the card, if still unclaimed."""
+        if target not in self.state.milestones_claimed:
+            self.state.milestones_claimed[target] = None
+            self.state.log(f"Milestone claimed: {target}!", "milestone")
+            return f"Milestone: {target}"
+        return f"Milestone {target} already claimed"
+
+    def _recruit_get_food(self, target: str) -> str:
+        """Gain the current food amount of the item named on the card."""
+        food_amount = self.state.tracks.food_amount
+        self.state.inventory.add(target, food_amount)
+        self.state.log(f"Get food: +{food_amount} {target}", "recruit_train")
+        return f"GET FOOD: +{food_amount} {target}"
 
     def _recruit_marketeer(self, name: str) -> str:
         """Recruit a marketeer to an open slot."""
@@ -1796,11 +2019,7 @@ class GameEngine:
                 )
                 # Gourmet Food Critic: also place 1 garden on the map
                 if name == "Gourmet Food Critic":
-                    map_tiles = (
-                        self.state.current_front_card.get("map_tiles", {})
-                        if self.state.current_front_card
-                        else {}
-                    )
+                    map_tiles = self._front_map_tiles()
                     dev_tile = map_tiles.get("develop_lobby", 1)
                     self.state.log(
                         f"Gourmet Food Critic: Place 1 garden on the map. Target tile: {dev_tile}",
@@ -1858,7 +2077,7 @@ class GameEngine:
 
         back_card = self.state.current_back_card
         if not back_card or "back" not in back_card:
-            self.state.phase = GamePhase.DEVELOP
+            self._advance()
             hint = self._worktime_turn_hint()
             return {
                 "status": "ok",
@@ -1870,31 +2089,28 @@ class GameEngine:
         demand_type = back.get("demand_type", "most_demand")
         food_items = back.get("food_items", [])
         multiplier = back.get("multiplier", 1)
-        food_amount = self.state.tracks.get_food_amount()
+        food_amount = self.state.tracks.food_amount
 
         if demand_type == "specific":
+            enabled = self.state.enabled_modules
+            amount = food_amount * multiplier
+            add = self.state.inventory.add
+            log = self.state.log
             # Left box: add specific items
+            parts = []
             for item in food_items:
-                if item in [fi.value for fi in FoodItem]:
-                    if _is_item_available(item, self.state.modules):
-                        self.state.inventory.add(item, food_amount * multiplier)
-                        self.state.log(
-                            f"+{food_amount * multiplier} {item}", "get_food"
-                        )
+                if item in _FOOD_ITEM_VALUES:
+                    if _is_item_available(item, enabled):
+                        add(item, amount)
+                        log(f"+{amount} {item}", "get_food")
+                        parts.append(f"+{amount} {item}")
                     else:
-                        self.state.log(
-                            f"Skipped {item} (module not in play)", "get_food"
-                        )
+                        log(f"Skipped {item} (module not in play)", "get_food")
             # Right box: add food_item (with module/fallback)
             right_msg = self._add_right_box_food(back, food_amount)
-            parts = []
-            for item in food_items:
-                if item in [fi.value for fi in FoodItem]:
-                    if _is_item_available(item, self.state.modules):
-                        parts.append(f"+{food_amount * multiplier} {item}")
             if right_msg:
                 parts.append(right_msg)
-            self.state.phase = GamePhase.DEVELOP
+            self._advance()
             hint = self._worktime_turn_hint()
             return {
                 "status": "ok",
@@ -1904,8 +2120,20 @@ class GameEngine:
                 + hint,
                 "next_phase": "develop",
             }
+        elif self._auto_input is not None:
+            input_data = self._auto_input(
+                "demand_info",
+                {
+                    "demand_type": demand_type,
+                    "multiplier": multiplier,
+                    "food_amount": food_amount,
+                },
+            )
+            return self._resolve_get_food(input_data)
         else:
             # Need player input about demand on the map
+            enabled = self.state.enabled_modules
+            food_options = list(_available_food_items(enabled))
             self.state.pending_input = {
                 "type": "demand_info",
                 "prompt": f"Which food items have demand tokens on the map? (for {demand_type.replace('_', ' ')})",
@@ -1919,22 +2147,14 @@ class GameEngine:
                         "label": "Items with demand on map",
                         "label_es": "Items con demanda en el mapa",
                         "type": "multiselect",
-                        "options": [
-                            fi.value
-                            for fi in FoodItem
-                            if _is_item_available(fi.value, self.state.modules)
-                        ],
+                        "options": food_options,
                     },
                     {
                         "name": "most_demand_items",
                         "label": "Item(s) with MOST demand tokens (select all tied items)",
                         "label_es": "Item(s) con MÁS fichas de demanda (selecciona todos los empatados)",
                         "type": "multiselect",
-                        "options": [
-                            fi.value
-                            for fi in FoodItem
-                            if _is_item_available(fi.value, self.state.modules)
-                        ],
+                        "options": food_options,
                         "condition": demand_type == "most_demand",
                     },
                 ],
@@ -1948,14 +2168,10 @@ class GameEngine:
 
     def _resolve_get_food(self, input_data: dict) -> dict:
         """Resolve Get Food phase after receiving demand info."""
-        back = (
-            self.state.current_back_card.get("back", {})
-            if self.state.current_back_card
-            else {}
-        )
+        back = self._back_side()
         demand_type = back.get("demand_type", "most_demand")
         multiplier = back.get("multiplier", 1)
-        food_amount = self.state.tracks.get_food_amount()
+        food_amount = self.state.tracks.food_amount
 
         items_with_demand = input_data.get("items_with_demand", [])
         most_demand_items = input_data.get("most_demand_items", [])
@@ -1970,11 +2186,12 @@ class GameEngine:
 
         added = []
         if demand_type == "all_demand":
+            amount = food_amount * multiplier
+            self.state.inventory.bulk_add((item, amount) for item in items_with_demand)
+            log = self.state.log
             for item in items_with_demand:
-                amount = food_amount * multiplier
-                self.state.inventory.add(item, amount)
                 added.append(f"+{amount} {item}")
-                self.state.log(f"All demand: +{amount} {item}", "get_food")
+                log(f"All demand: +{amount} {item}", "get_food")
         elif demand_type == "most_demand":
             if len(most_demand_items) == 1:
                 # Single winner — no tie
@@ -1985,10 +2202,11 @@ class GameEngine:
                 self.state.log(f"Most demand: +{amount} {item}", "get_food")
             elif len(most_demand_items) > 1:
                 # Tie! Ask for demand tokens on houses to break it
+                tied = ", ".join(most_demand_items)
                 self.state.pending_input = {
                     "type": "demand_tiebreak",
-                    "prompt": f"Tie between {', '.join(most_demand_items)}! How many demand tokens on HOUSES for each?",
-                    "prompt_es": f"¡Empate entre {', '.join(most_demand_items)}! ¿Cuántas fichas de demanda en CASAS para cada uno?",
+                    "prompt": f"Tie between {tied}! How many demand tokens on HOUSES for each?",
+                    "prompt_es": f"¡Empate entre {tied}! ¿Cuántas fichas de demanda en CASAS para cada uno?",
                     "tied_items": most_demand_items,
                     "multiplier": multiplier,
                     "food_amount": food_amount,
@@ -1997,10 +2215,7 @@ class GameEngine:
                             "name": f"house_demand_{item}",
                             "label": f"Demand on houses: {item}",
                             "label_es": f"Demanda en casas: {item}",
-                            "type": "number",
-                            "min": 0,
-                            "max": 50,
-                            "default": 0,
+                            **_HOUSE_DEMAND_FIELD,
                         }
                         for item in most_demand_items
                     ],
@@ -2008,7 +2223,7 @@ class GameEngine:
                 self.state.phase = GamePhase.WAITING_FOR_INPUT
                 return {
                     "status": "waiting",
-                    "message": f"Tie for most demand between: {', '.join(most_demand_items)}. Need house demand info.",
+                    "message": f"Tie for most demand between: {tied}. Need house demand info.",
                     "input_needed": self.state.pending_input,
                 }
             else:
@@ -2034,13 +2249,8 @@ class GameEngine:
         multiplier = pending.get("multiplier", 1)
         food_amount = pending.get("food_amount", 1)
 
-        # Collect house demand counts from user input
-        house_counts = {}
-        for item in tied_items:
-            house_counts[item] = input_data.get(f"house_demand_{item}", 0)
-
-        max_count = max(house_counts.values()) if house_counts else 0
-        winners = [item for item, count in house_counts.items() if count == max_count]
+        # Most demand tokens on houses among the tied items
+        max_count, winners = _house_demand_leaders(tied_items, input_data)
 
         if len(winners) == 1:
             winner = winners[0]
@@ -2048,7 +2258,7 @@ class GameEngine:
                 f"Tiebreak by houses: {winner} ({max_count} on houses)", "get_food"
             )
         else:
-            winner = random.choice(winners)
+            winner = self._rng.choice(winners)
             self.state.log(
                 f"Tiebreak random: {winner} (still tied on houses)", "get_food"
             )
@@ -2058,11 +2268,7 @@ class GameEngine:
         self.state.log(f"Most demand: +{amount} {winner}", "get_food")
 
         # Right box: add food_item (with module/fallback)
-        back = (
-            self.state.current_back_card.get("back", {})
-            if self.state.current_back_card
-            else {}
-        )
+        back = self._back_side()
         right_msg = self._add_right_box_food(back, food_amount)
 
         self.state.pending_input = None
@@ -2128,18 +2334,10 @@ class GameEngine:
         self.state.log(f"=== INITIATE MARKETING ===", "phase")
 
         # Get market tile and market item from current card
-        map_tiles = (
-            self.state.current_front_card.get("map_tiles", {})
-            if self.state.current_front_card
-            else {}
-        )
+        map_tiles = self._front_map_tiles()
         market_tile = map_tiles.get("market", 1)
 
-        front = (
-            self.state.current_front_card.get("front", {})
-            if self.state.current_front_card
-            else {}
-        )
+        front = self._front_actions()
         market_item = front.get("market_item") or "unknown"
 
         # Find newly placed marketeers (in a slot, not busy yet)
@@ -2151,15 +2349,29 @@ class GameEngine:
 
         if not new_marketeers:
             # No new campaigns to set up — skip silently
-            self.state.phase = GamePhase.GET_FOOD
+            self._advance()
             hint = self._worktime_turn_hint()
             msg = "Initiate Marketing: No new marketeers to initiate." + hint
             return {"status": "ok", "message": msg, "next_phase": "get_food"}
 
+        if self._auto_input is not None:
+            input_data = self._auto_input(
+                "initiate_marketing_campaigns",
+                {
+                    "market_item": market_item,
+                    "market_tile": market_tile,
+                    "slots": [slot.slot_number for slot in new_marketeers],
+                },
+            )
+            return self._resolve_initiate_marketing(
+                input_data, market_item, market_tile
+            )
+
         # Build prompt fields — one campaign number field per new marketeer
+        durations = MARKETEER_DURATIONS
         fields = []
         for slot in new_marketeers:
-            duration = MARKETEER_DURATIONS.get(slot.marketeer, 3)
+            duration = durations.get(slot.marketeer, 3)
             if duration == -1:
                 dur_label = "permanent"
                 dur_label_es = "permanente"
@@ -2177,10 +2389,7 @@ class GameEngine:
                         f"Campaña # para {slot.marketeer} "
                         f"(casilla {slot.slot_number}, {market_item}, {dur_label_es})"
                     ),
-                    "type": "number",
-                    "min": 1,
-                    "max": 99,
-                    "default": 1,
+                    **_CAMPAIGN_NUMBER_FIELD,
                 }
             )
 
@@ -2206,24 +2415,38 @@ class GameEngine:
             "input_needed": self.state.pending_input,
         }
 
-    def _resolve_initiate_marketing(self, input_data: dict) -> dict:
-        """Process campaign number assignments from the user."""
-        pending = self.state.pending_input or {}
-        market_item = pending.get("market_item", "unknown")
-        market_tile = pending.get("market_tile", 1)
+    def _resolve_initiate_marketing(
+        self,
+        input_data: dict,
+        market_item: Optional[str] = None,
+        market_tile: Optional[int] = None,
+    ) -> dict:
+        """Process campaign number assignments from the user.
+
+        The market item and tile come from the pending prompt unless the
+        caller passes them directly (auto_input skips the prompt).
+        """
+        if market_item is None:
+            pending = self.state.pending_input or {}
+            market_item = pending.get("market_item", "unknown")
+            market_tile = pending.get("market_tile", 1)
         self.state.pending_input = None
 
+        durations = MARKETEER_DURATIONS
+        log = self.state.log
+        claimed = self.state.milestones_claimed
+        turn = self.state.turn_number
         campaigns = []
         for slot in self.state.marketeer_slots:
             if slot.marketeer and not slot.is_busy:
                 campaign_num = input_data.get(f"campaign_slot_{slot.slot_number}", 1)
-                duration = MARKETEER_DURATIONS.get(slot.marketeer, 3)
+                duration = durations.get(slot.marketeer, 3)
 
                 slot.is_busy = True
                 slot.market_item = market_item
                 slot.campaign_number = campaign_num
                 slot.campaigns_left = duration  # -1 for eternal (Rural Marketeer)
-                slot.placed_turn = self.state.turn_number
+                slot.placed_turn = turn
 
                 dur_desc = "permanent" if duration == -1 else f"{duration} campaigns"
                 campaigns.append(
@@ -2231,16 +2454,16 @@ class GameEngine:
                     f"{market_item} on tile {market_tile}, "
                     f"campaign #{campaign_num}, {dur_desc}"
                 )
-                self.state.log(
+                log(
                     f"{slot.marketeer} markets {market_item}. "
                     f"Campaign #{campaign_num}. Target tile: {market_tile}. "
                     f"Duration: {dur_desc}.",
                     "marketing",
                 )
                 # Milestone: first to market
-                if "first_to_market" not in self.state.milestones_claimed:
-                    self.state.milestones_claimed.append("first_to_market")
-                    self.state.log("Milestone claimed: First to Market!", "milestone")
+                if "first_to_market" not in claimed:
+                    claimed["first_to_market"] = None
+                    log("Milestone claimed: First to Market!", "milestone")
 
         if self.state.mass_marketeer:
             campaigns.append("Mass Marketeer: additional marketing campaign")
@@ -2263,17 +2486,9 @@ class GameEngine:
         """DEVELOP phase: place house/garden if star on card."""
         self.state.log(f"=== DEVELOP ===", "phase")
 
-        stars = getattr(self.state, "pending_stars", [])
-        back = (
-            self.state.current_back_card.get("back", {})
-            if self.state.current_back_card
-            else {}
-        )
-        map_tiles = (
-            self.state.current_front_card.get("map_tiles", {})
-            if self.state.current_front_card
-            else {}
-        )
+        stars = self.state.pending_stars
+        back = self._back_side()
+        map_tiles = self._front_map_tiles()
         dev_tile = map_tiles.get("develop_lobby", 1)
 
         has_develop = "develop" in stars
@@ -2289,7 +2504,7 @@ class GameEngine:
             else:
                 desc = f"Place house #{dev_house}" if dev_house else "Place house"
             self.state.log(f"DEVELOP ★: {desc}. Target tile: {dev_tile}", "develop")
-            self.state.phase = GamePhase.LOBBY
+            self._advance()
             hint = self._worktime_turn_hint()
             return {
                 "status": "ok",
@@ -2300,7 +2515,7 @@ class GameEngine:
                 "next_phase": "lobby",
             }
 
-        self.state.phase = GamePhase.LOBBY
+        self._advance()
         hint = self._worktime_turn_hint()
         return {
             "status": "ok",
@@ -2314,7 +2529,7 @@ class GameEngine:
 
         # Lobby action requires the Lobbyists module expansion
         if not self.state.modules.get("lobbyists"):
-            self.state.phase = GamePhase.EXPAND_CHAIN
+            self._advance()
             hint = self._worktime_turn_hint()
             return {
                 "status": "ok",
@@ -2322,17 +2537,9 @@ class GameEngine:
                 "next_phase": "expand_chain",
             }
 
-        stars = getattr(self.state, "pending_stars", [])
-        back = (
-            self.state.current_back_card.get("back", {})
-            if self.state.current_back_card
-            else {}
-        )
-        map_tiles = (
-            self.state.current_front_card.get("map_tiles", {})
-            if self.state.current_front_card
-            else {}
-        )
+        stars = self.state.pending_stars
+        back = self._back_side()
+        map_tiles = self._front_map_tiles()
         dev_tile = map_tiles.get("develop_lobby", 1)
 
         lobby_type = back.get("lobby_type")
@@ -2347,7 +2554,7 @@ class GameEngine:
             else:
                 desc = "Place road"
             self.state.log(f"LOBBY ★: {desc}. Target tile: {dev_tile}", "lobby")
-            self.state.phase = GamePhase.EXPAND_CHAIN
+            self._advance()
             hint = self._worktime_turn_hint()
             return {
                 "status": "ok",
@@ -2358,7 +2565,7 @@ class GameEngine:
                 "next_phase": "expand_chain",
             }
 
-        self.state.phase = GamePhase.EXPAND_CHAIN
+        self._advance()
         hint = self._worktime_turn_hint()
         return {
             "status": "ok",
@@ -2370,12 +2577,8 @@ class GameEngine:
         """EXPAND CHAIN phase: place new restaurant if star on card."""
         self.state.log(f"=== EXPAND CHAIN ===", "phase")
 
-        stars = getattr(self.state, "pending_stars", [])
-        map_tiles = (
-            self.state.current_front_card.get("map_tiles", {})
-            if self.state.current_front_card
-            else {}
-        )
+        stars = self.state.pending_stars
+        map_tiles = self._front_map_tiles()
         map_tile = map_tiles.get("expand_chain", 1)
 
         if (
@@ -2417,7 +2620,7 @@ class GameEngine:
                 f"COFFEE SHOP ★: Place a coffee shop if available. Target tile: {coffee_tile}",
                 "expand",
             )
-            self.state.phase = GamePhase.DINNERTIME
+            self._advance()
             hint = self._worktime_turn_hint(is_last_worktime=True)
             return {
                 "status": "ok",
@@ -2426,7 +2629,7 @@ class GameEngine:
                 "next_phase": "dinnertime",
             }
 
-        self.state.phase = GamePhase.DINNERTIME
+        self._advance()
         hint = self._worktime_turn_hint(is_last_worktime=True)
         return {
             "status": "ok",
@@ -2436,7 +2639,7 @@ class GameEngine:
 
     def _continue_after_stars(self) -> dict:
         """Continue the phase flow after handling star actions."""
-        stars = getattr(self.state, "pending_stars", [])
+        stars = self.state.pending_stars
 
         # Check if we still need coffee shop
         if "coffee_shop" in stars and self.state.modules.get("coffee"):
@@ -2470,22 +2673,7 @@ class GameEngine:
             "type": "dinnertime_result",
             "prompt": f"Enter dinnertime earnings. {info}",
             "prompt_es": f"Introduce las ganancias de la cena. {info}",
-            "fields": [
-                {
-                    "name": "chain_earned",
-                    "label": "Chain earned ($)",
-                    "label_es": "La Cadena ganó ($)",
-                    "type": "number",
-                    "min": 0,
-                },
-                {
-                    "name": "player_earned",
-                    "label": "You earned ($)",
-                    "label_es": "Tú ganaste ($)",
-                    "type": "number",
-                    "min": 0,
-                },
-            ],
+            "fields": _DINNERTIME_EARNINGS_FIELDS,
         }
         self.state.phase = GamePhase.WAITING_FOR_INPUT
         return {
@@ -2496,34 +2684,23 @@ class GameEngine:
 
     # ─── Sold-items prompt helper ────────────────────────────────────────
 
-    _FOOD_LABELS_ES = {
-        "burger": "Hamburguesa",
-        "pizza": "Pizza",
-        "sushi": "Sushi",
-        "noodle": "Fideos",
-        "coffee": "Café",
-        "kimchi": "Kimchi",
-        "beer": "Cerveza",
-        "lemonade": "Limonada",
-        "softdrink": "Refresco",
-    }
-
     def _build_sold_items_prompt(self) -> dict | None:
         """Build a WAITING_FOR_INPUT prompt asking which items were sold.
 
         Returns None if inventory is completely empty (nothing to sell).
         """
+        enabled = self.state.enabled_modules
+        inventory = self.state.inventory
+        if not inventory.has_available(enabled):
+            return None
+
         fields = []
-        for fi in FoodItem:
-            item_key = fi.value
-            count = self.state.inventory.total(item_key)
+        # Expansion items whose module is disabled are never offered
+        for item_key in _available_food_items(enabled):
+            count = inventory.total(item_key)
             if count <= 0:
                 continue
-            # Skip expansion items whose module is disabled
-            if not _is_item_available(item_key, self.state.modules):
-                continue
-            label_en = f"{fi.label()} sold"
-            label_es = f"{self._FOOD_LABELS_ES.get(item_key, fi.label())} vendido"
+            label_en, label_es = _SOLD_ITEM_LABELS[item_key]
             fields.append(
                 {
                     "name": item_key,
@@ -2565,12 +2742,8 @@ class GameEngine:
             "payday",
         )
 
-        self.state.phase = GamePhase.MARKETING_CAMPAIGNS
-        return {
-            "status": "ok",
-            "message": "Payday — Pay your employees. The Chain does not pay salaries.",
-            "next_phase": "marketing_campaigns",
-        }
+        self._advance()
+        return _RESULT_PAYDAY
 
     # ─── Marketing Campaigns (resolution) ────────────────────────────────
 
@@ -2582,25 +2755,26 @@ class GameEngine:
         """
         self.state.log(f"=== MARKETING CAMPAIGNS ===", "phase")
 
+        log = self.state.log
         msgs = []
         for slot in self.state.marketeer_slots:
             if slot.marketeer and slot.is_busy and slot.campaigns_left is not None:
+                # "<Marketeer> (slot N)" opens both the log line and the message
+                who = f"{slot.marketeer} (slot {slot.slot_number})"
+                campaign = f"{slot.market_item}, #{slot.campaign_number}"
                 # Skip eternal campaigns (Rural Marketeer: campaigns_left == -1)
                 if slot.campaigns_left == -1:
-                    self.state.log(
-                        f"{slot.marketeer} (slot {slot.slot_number}): "
-                        f"permanent campaign ({slot.market_item}, #{slot.campaign_number}).",
+                    log(
+                        f"{who}: permanent campaign ({campaign}).",
                         "marketing_campaigns",
                     )
-                    msgs.append(
-                        f"{slot.marketeer} (slot {slot.slot_number}): permanent"
-                    )
+                    msgs.append(f"{who}: permanent")
                     continue
                 slot.campaigns_left -= 1
                 if slot.campaigns_left <= 0:
                     expired_name = slot.marketeer
-                    self.state.log(
-                        f"{expired_name} (slot {slot.slot_number}) campaign expired! "
+                    log(
+                        f"{who} campaign expired! "
                         f"Marketing {slot.market_item}, campaign #{slot.campaign_number}. "
                         f"Marketeer removed.",
                         "marketing_campaigns",
@@ -2608,17 +2782,13 @@ class GameEngine:
                     # Brand Director goes to employee pile when campaign expires
                     if expired_name == "Brand Director":
                         self.state.employee_pile.append("Brand Director")
-                        self.state.log(
-                            f"Brand Director placed in employee pile.",
+                        log(
+                            "Brand Director placed in employee pile.",
                             "marketing_campaigns",
                         )
-                        msgs.append(
-                            f"{expired_name} (slot {slot.slot_number}) campaign expired — moved to employee pile"
-                        )
+                        msgs.append(f"{who} campaign expired — moved to employee pile")
                     else:
-                        msgs.append(
-                            f"{expired_name} (slot {slot.slot_number}) campaign expired — removed"
-                        )
+                        msgs.append(f"{who} campaign expired — removed")
                     slot.marketeer = None
                     slot.is_busy = False
                     slot.market_item = None
@@ -2626,21 +2796,17 @@ class GameEngine:
                     slot.campaigns_left = None
                     slot.placed_turn = None
                 else:
-                    self.state.log(
-                        f"{slot.marketeer} (slot {slot.slot_number}): "
-                        f"{slot.campaigns_left} campaign(s) remaining "
-                        f"({slot.market_item}, #{slot.campaign_number}).",
+                    left = slot.campaigns_left
+                    log(
+                        f"{who}: {left} campaign(s) remaining ({campaign}).",
                         "marketing_campaigns",
                     )
-                    msgs.append(
-                        f"{slot.marketeer} (slot {slot.slot_number}): "
-                        f"{slot.campaigns_left} left"
-                    )
+                    msgs.append(f"{who}: {left} left")
 
         if not msgs:
             self.state.log("No active marketing campaigns.", "marketing_campaigns")
 
-        self.state.phase = GamePhase.CLEANUP
+        self._advance()
         return {
             "status": "ok",
             "message": "Marketing Campaigns: "
@@ -2650,67 +2816,83 @@ class GameEngine:
 
     # ─── Cleanup ─────────────────────────────────────────────────────────
 
+    # Cleanup action type -> handler method name. Handlers take the action's
+    # non-zero value and the message list, and return True when the Action
+    # Deck must be reshuffled.
+    _CLEANUP_ACTIONS = {
+        "get_kimchi": "_cleanup_get_kimchi",
+        "move_distance": "_cleanup_move_distance",
+        "move_waitress": "_cleanup_move_waitress",
+        "inventory_drop": "_cleanup_inventory_drop",
+        "move_recruit_train": "_cleanup_move_recruit_train",
+    }
+
+    def _cleanup_get_kimchi(self, value: int, msgs: list) -> bool:
+        """GET KIMCHI: +1 kimchi if the Kimchi Master is hired and kimchi is in play."""
+        if not self.state.modules.get("kimchi"):
+            return False
+        if "Kimchi Master" in self.state.employee_pile or any(
+            slot.marketeer == "Kimchi Master" for slot in self.state.marketeer_slots
+        ):
+            self.state.inventory.add("kimchi", 1)
+            msgs.append("Kimchi +1")
+            self.state.log("Kimchi Master: +1 kimchi.", "cleanup")
+        return False
+
+    def _cleanup_move_distance(self, value: int, msgs: list) -> bool:
+        """Move the Price+Distance marker."""
+        old, new, _ = self.state.tracks.price_distance.move(value)
+        msgs.append(f"Distance: {old}→{new}")
+        self.state.log(f"Cleanup: Price+Distance {old} → {new}", "cleanup")
+        self._check_track_milestones()
+        return False
+
+    def _cleanup_move_waitress(self, value: int, msgs: list) -> bool:
+        """Move the Waitresses marker."""
+        old, new, _ = self.state.tracks.waitresses.move(value)
+        msgs.append(f"Waitress: {old}→{new}")
+        self.state.log(f"Cleanup: Waitresses {old} → {new}", "cleanup")
+        return False
+
+    def _cleanup_inventory_drop(self, value: int, msgs: list) -> bool:
+        """Drop the inventory's top row."""
+        drop_details = self.state.inventory.inventory_drop()
+        if drop_details:
+            msgs.append(f"Inventory drop: {', '.join(drop_details)}")
+            self.state.log(
+                f"Cleanup: Inventory drop — {', '.join(drop_details)}",
+                "cleanup",
+            )
+        else:
+            msgs.append("Inventory drop (no items on top row)")
+            self.state.log("Cleanup: Inventory drop — nothing to drop.", "cleanup")
+        return False
+
+    def _cleanup_move_recruit_train(self, value: int, msgs: list) -> bool:
+        """Move the Recruit & Train marker; crossing the boundary forces a shuffle."""
+        old, new, crossed = self.state.tracks.recruit_train.move(value)
+        msgs.append(f"R&T track: {old}→{new}")
+        self.state.log(f"Cleanup: Recruit & Train {old} → {new}", "cleanup")
+        self._check_track_milestones()
+        return crossed
+
     def _do_cleanup(self) -> dict:
         """CLEANUP phase: apply all cleanup actions from the back card."""
         self.state.log(f"=== CLEANUP ===", "phase")
 
-        back = (
-            self.state.current_back_card.get("back", {})
-            if self.state.current_back_card
-            else {}
-        )
+        back = self._back_side()
         cleanup_actions = back.get("cleanup_actions", [])
 
         msgs = []
         shuffle_needed = False
 
         for ca in cleanup_actions:
-            ca_type = ca["type"]
             ca_value = ca["value"]
-
-            if ca_type == "get_kimchi" and ca_value != 0:
-                # GET KIMCHI: if Kimchi Master is in employee pile and kimchi module active
-                if (
-                    "Kimchi Master" in [s.marketeer for s in self.state.marketeer_slots]
-                    or "Kimchi Master" in self.state.employee_pile
-                ):
-                    if self.state.modules.get("kimchi"):
-                        self.state.inventory.add("kimchi", 1)
-                        msgs.append("Kimchi +1")
-                        self.state.log("Kimchi Master: +1 kimchi.", "cleanup")
-
-            elif ca_type == "move_distance" and ca_value != 0:
-                old, new, _ = self.state.tracks.price_distance.move(ca_value)
-                msgs.append(f"Distance: {old}→{new}")
-                self.state.log(f"Cleanup: Price+Distance {old} → {new}", "cleanup")
-                self._check_track_milestones()
-
-            elif ca_type == "move_waitress" and ca_value != 0:
-                old, new, _ = self.state.tracks.waitresses.move(ca_value)
-                msgs.append(f"Waitress: {old}→{new}")
-                self.state.log(f"Cleanup: Waitresses {old} → {new}", "cleanup")
-
-            elif ca_type == "inventory_drop" and ca_value != 0:
-                drop_details = self.state.inventory.inventory_drop()
-                if drop_details:
-                    msgs.append(f"Inventory drop: {', '.join(drop_details)}")
-                    self.state.log(
-                        f"Cleanup: Inventory drop — {', '.join(drop_details)}",
-                        "cleanup",
-                    )
-                else:
-                    msgs.append("Inventory drop (no items on top row)")
-                    self.state.log(
-                        "Cleanup: Inventory drop — nothing to drop.", "cleanup"
-                    )
-
-            elif ca_type == "move_recruit_train" and ca_value != 0:
-                old, new, crossed = self.state.tracks.recruit_train.move(ca_value)
-                msgs.append(f"R&T track: {old}→{new}")
-                self.state.log(f"Cleanup: Recruit & Train {old} → {new}", "cleanup")
-                self._check_track_milestones()
-                if crossed:
-                    shuffle_needed = True
+            if ca_value == 0:
+                continue
+            handler_name = self._CLEANUP_ACTIONS.get(ca["type"])
+            if handler_name and getattr(self, handler_name)(ca_value, msgs):
+                shuffle_needed = True
 
         # Cap inventory (max 10, excluding coffee)
         cap_details = self.state.inventory.cap_inventory()
@@ -2722,26 +2904,18 @@ class GameEngine:
 
         # Shuffle if needed
         if shuffle_needed:
-            self.state.reshuffle_deck()
+            # Never leave a competition card on top after the shuffle
+            self.state.reshuffle_deck(self._rng, keep_off_top=_COMPETITION_CARD_TYPES)
             self.state.log(
                 "SHUFFLE triggered! Action Deck reshuffled with discard pile.",
                 "cleanup",
             )
             msgs.append("ACTION DECK SHUFFLED!")
 
-            # If competition card ends up on top after shuffle, shuffle again
-            top = self.state.action_deck.peek()
-            while top and top.card_type in (CardType.WARM, CardType.COOL):
-                self.state.reshuffle_deck()
-                self.state.log(
-                    "Competition card on top after shuffle — reshuffling.", "cleanup"
-                )
-                top = self.state.action_deck.peek()
-
         # End of turn — campaign decrement is now handled in Marketing Campaigns phase
         # Advance to next turn
         self.state.turn_number += 1
-        self.state.phase = GamePhase.RESTRUCTURING
+        self._advance()
 
         # Clear pending stars
         self.state.pending_stars = []
@@ -2765,17 +2939,16 @@ class GameEngine:
     def undo(self) -> dict:
         """Undo the last action by restoring previous state snapshot."""
         if not self.state.history:
-            return {"status": "error", "message": "Nothing to undo."}
+            return _RESULT_NOTHING_TO_UNDO
 
-        snapshot_json = self.state.history.pop()
-        snapshot = __import__("json").loads(snapshot_json)
+        snapshot = self.state.history.pop()
 
         # Preserve history stack
         history = self.state.history
 
         # Rebuild state from snapshot (simplified — restores key fields)
         self.state.turn_number = snapshot.get("turn_number", 0)
-        self.state.phase = GamePhase(snapshot.get("phase", "setup"))
+        self.state.phase = _PHASE_BY_VALUE[snapshot.get("phase", "setup")]
         self.state.bank_breaks = snapshot.get("bank_breaks", 0)
         self.state.current_front_card = snapshot.get("current_front_card")
         self.state.current_back_card = snapshot.get("current_back_card")
@@ -2786,7 +2959,7 @@ class GameEngine:
         self.state.chain_total_cash = snapshot.get("chain_total_cash", 0)
         self.state.bonus_cash_multiplier = snapshot.get("bonus_cash_multiplier", 1.0)
         self.state.no_driveins_this_turn = snapshot.get("no_driveins_this_turn", False)
-        self.state.milestones_claimed = snapshot.get("milestones_claimed", [])
+        self.state.milestones_claimed = snapshot.get("milestones_claimed", {})
         self.state.restaurants = snapshot.get("restaurants", [])
         self.state.employee_pile = snapshot.get("employee_pile", [])
         self.state.mass_marketeer = snapshot.get("mass_marketeer", False)
@@ -2795,71 +2968,49 @@ class GameEngine:
         self.state.deck_cycles = snapshot.get("deck_cycles", 0)
         self.state.total_cards_drawn = snapshot.get("total_cards_drawn", 0)
 
-        # Restore decks from snapshot card lists
-        from .cards import create_all_decks as _create_all_decks
-
-        _ad, _wd, _cd = _create_all_decks()
-        _all_cards = {}
-        for c in _ad.cards + _wd.cards + _cd.cards:
-            _all_cards[(c.card_type.value, c.card_number)] = c
-
-        for deck_key, deck_attr in [
-            ("action_deck", "action_deck"),
-            ("warm_deck", "warm_deck"),
-            ("cool_deck", "cool_deck"),
-        ]:
-            deck_snap = snapshot.get(deck_key, {})
-            card_list = deck_snap.get("cards", [])
-            if card_list:
-                new_deck = Deck(name=deck_snap.get("name", deck_key))
-                for cd in card_list:
-                    key = (cd["card_type"], cd["card_number"])
-                    if key in _all_cards:
-                        new_deck.cards.append(_all_cards[key])
+        # Restore decks from snapshot card references
+        all_cards = card_catalog()
+
+        for deck_attr in ("action_deck", "warm_deck", "cool_deck"):
+            card_refs = snapshot.get(deck_attr, [])
+            if card_refs:
+                new_deck = Deck(name=getattr(self.state, deck_attr).name)
+                for card_type, card_number in card_refs:
+                    key = (card_type, card_number)
+                    if key in all_cards:
+                        new_deck.cards.append(all_cards[key])
                 setattr(self.state, deck_attr, new_deck)
 
         # Restore tracks
         tracks_data = snapshot.get("tracks", {})
         if "recruit_train" in tracks_data:
-            self.state.tracks.recruit_train.position = tracks_data["recruit_train"][
-                "position"
-            ]
+            self.state.tracks.recruit_train.position = tracks_data["recruit_train"]
         if "price_distance" in tracks_data:
-            self.state.tracks.price_distance.position = tracks_data["price_distance"][
-                "position"
-            ]
+            self.state.tracks.price_distance.position = tracks_data["price_distance"]
         if "waitresses" in tracks_data:
-            self.state.tracks.waitresses.position = tracks_data["waitresses"][
-                "position"
-            ]
+            self.state.tracks.waitresses.position = tracks_data["waitresses"]
         if "competition" in tracks_data:
             self.state.tracks.competition = CompetitionLevel(
-                tracks_data["competition"]["level"]
+                tracks_data["competition"]
             )
 
         # Restore inventory
         inv_data = snapshot.get("inventory", {})
-        for item, vals in inv_data.items():
-            if item in self.state.inventory.items:
-                if isinstance(vals, dict):
-                    # Migration: old format had {top, bottom}
-                    self.state.inventory.items[item] = vals.get(
-                        "count", vals.get("top", 0) + vals.get("bottom", 0)
-                    )
-                else:
-                    self.state.inventory.items[item] = vals
+        for item, count in inv_data.items():
+            self.state.inventory.set_count(item, count)
 
         # Restore marketeer slots
         slots_data = snapshot.get("marketeer_slots", [])
-        for i, sd in enumerate(slots_data):
+        for i, (marketeer, is_busy) in enumerate(slots_data):
             if i < len(self.state.marketeer_slots):
-                self.state.marketeer_slots[i].marketeer = sd.get("marketeer")
-                self.state.marketeer_slots[i].is_busy = sd.get("is_busy", False)
+                self.state.marketeer_slots[i].marketeer = marketeer
+                self.state.marketeer_slots[i].is_busy = is_busy
 
         self.state.history = history
         self.state.log("Undo performed.", "system")
+        self.state.flush_log()
 
-        return {"status": "ok", "message": "Last action undone."}
+        return _RESULT_UNDONE
 
     # ─── Quick mode ──────────────────────────────────────────────────────
 
@@ -2869,9 +3020,9 @@ class GameEngine:
         if not top_card:
             return {"status": "error", "message": "Deck is empty!"}
 
-        self.state.current_back_card = top_card.to_dict()
+        self.state.current_back_card = top_card.as_dict
         next_card = self.state.action_deck.peek()
-        self.state.current_front_card = next_card.to_dict() if next_card else None
+        self.state.current_front_card = next_card.as_dict if next_card else None
         self.state.action_deck.place_under(top_card)
 
         # Update deck progress counters
@@ -2891,13 +3042,13 @@ class GameEngine:
     def quick_update_track(self, track_name: str, value: int) -> dict:
         """Quick mode: manually set a track value."""
         if track_name == "recruit_train":
-            self.state.tracks.recruit_train.position = max(1, min(4, value))
+            self.state.tracks.recruit_train.position = _clamp(value, 1, 4)
         elif track_name == "price_distance":
-            self.state.tracks.price_distance.position = max(6, min(10, value))
+            self.state.tracks.price_distance.position = _clamp(value, 6, 10)
         elif track_name == "waitresses":
-            self.state.tracks.waitresses.position = max(0, min(4, value))
+            self.state.tracks.waitresses.position = _clamp(value, 0, 4)
         elif track_name == "competition":
-            self.state.tracks.competition = CompetitionLevel(max(0, min(4, value)))
+            self.state.tracks.competition = CompetitionLevel(_clamp(value, 0, 4))
         else:
             return {"status": "error", "message": f"Unknown track: {track_name}"}
 
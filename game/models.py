@@ -1,12 +1,12 @@
 """Data models for The Chain automa."""
 
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 import random
 import copy
-import json
 
 
 # ─── Enums ───────────────────────────────────────────────────────────────────
@@ -64,8 +64,11 @@ class DemandType(Enum):
     ALL = "all_demand"
 
 
+_DEMAND_TYPE_VALUES = frozenset(d.value for d in DemandType)
+
+
 # Core items are always available; module items require expansion toggle
-CORE_FOOD_ITEMS = {"burger", "pizza", "beer", "lemonade", "softdrink"}
+CORE_FOOD_ITEMS = frozenset({"burger", "pizza", "beer", "lemonade", "softdrink"})
 
 
 class FoodItem(Enum):
@@ -90,7 +93,7 @@ class FoodItem(Enum):
 # ─── Card model ──────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionSlot:
     """One of the 4 action slots on an Action Deck card front (RECRUIT & TRAIN side)."""
 
@@ -98,7 +101,7 @@ class ActionSlot:
     action_type: str  # "recruit_marketeer", "recruit_employee", "move_distance",
     # "move_waitress", "claim_milestone", "get_food"
     target: str  # e.g., "Zeppelin Pilot", "Burger Chef", "-3", "+1", milestone name
-    fallback_food: Optional[str | list] = (
+    fallback_food: Optional[list[str]] = (
         None  # Food item(s) if action can't be taken (module not in use)
     )
     requires_module: Optional[str] = None  # Module that must be active for this action
@@ -107,7 +110,7 @@ class ActionSlot:
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CardFront:
     """RECRUIT & TRAIN side of an Action Deck card."""
 
@@ -115,7 +118,7 @@ class CardFront:
     market_item: Optional[str] = None  # Food/drink shown on lower-left corner
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CleanupAction:
     """One cleanup action on the back of an Action Deck card."""
 
@@ -123,7 +126,7 @@ class CleanupAction:
     value: int = 0  # +/- amount
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CardBack:
     """GET FOOD & DRINKS / CLEANUP side of an Action Deck card."""
 
@@ -143,7 +146,7 @@ class CardBack:
     lobby_house: Optional[str] = None  # House number for park (e.g. "4", "pi")
 
 
-@dataclass
+@dataclass(slots=True)
 class CompetitionEffect:
     """Effect of a Competition Card."""
 
@@ -157,9 +160,62 @@ class CompetitionEffect:
     inventory_drop: bool = False
     inventory_loss_items: list[str] = field(default_factory=list)
     map_tile: int = 1
+    # food_adjustments split once at load: (demand_type, multiplier) entries
+    # that need demand info from the player, and (item, multiplier, module,
+    # fallback) entries that can be applied straight away
+    demand_adjustments: tuple[tuple[str, int], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    item_adjustments: tuple[tuple, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
 
+    def __post_init__(self):
+        demand = []
+        items = []
+        for adj in self.food_adjustments:
+            item = adj["item"]
+            multiplier = adj.get("amount", 1)
+            if item in _DEMAND_TYPE_VALUES:
+                demand.append((item, multiplier))
+            else:
+                items.append((item, multiplier, adj.get("module"), adj.get("fallback")))
+        self.demand_adjustments = tuple(demand)
+        self.item_adjustments = tuple(items)
+
+
+@dataclass(slots=True)
+class PendingCompetitionAction:
+    """A competition card effect queued until the player can act on it."""
+
+    action: str  # "competition_expand_chain", "competition_demand_info",
+    # "check_stacked_competition"
+    map_tile: int = 1
+    demand_type: str = "most_demand"
+    multiplier: int = 1
+    food_amount: int = 2
 
-@dataclass
+    def to_dict(self) -> dict:
+        return {
+            "action": self.action,
+            "map_tile": self.map_tile,
+            "demand_type": self.demand_type,
+            "multiplier": self.multiplier,
+            "food_amount": self.food_amount,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PendingCompetitionAction":
+        return cls(
+            action=data.get("action", ""),
+            map_tile=data.get("map_tile", 1),
+            demand_type=data.get("demand_type", "most_demand"),
+            multiplier=data.get("multiplier", 1),
+            food_amount=data.get("food_amount", 2),
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class Card:
     """A single card in the game."""
 
@@ -179,6 +235,11 @@ class Card:
     # Competition cards have a single effect
     competition_effect: Optional[CompetitionEffect] = None
 
+    # Memoized as_dict (cards never change once loaded)
+    _as_dict: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def image_front(self) -> str:
         return f"/static/cards/{self.card_type.value}_{self.card_number:02d}_front.png"
@@ -187,7 +248,22 @@ class Card:
     def image_back(self) -> str:
         return f"/static/cards/{self.card_type.value}_{self.card_number:02d}_back.png"
 
+    @property
+    def as_dict(self) -> dict:
+        """Serialized card, built once and shared between callers.
+
+        Treat the result as read-only; use to_dict() for a copy to add keys to.
+        """
+        d = self._as_dict
+        if d is None:
+            d = self._build_dict()
+            object.__setattr__(self, "_as_dict", d)
+        return d
+
     def to_dict(self) -> dict:
+        return dict(self.as_dict)
+
+    def _build_dict(self) -> dict:
         d = {
             "id": self.id,
             "card_type": self.card_type.value,
@@ -245,30 +321,61 @@ class Card:
 # ─── Deck ────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class Deck:
     """A deck of cards with draw, place-on-top, place-under, shuffle operations."""
 
     cards: list[Card] = field(default_factory=list)
     name: str = ""
 
-    def shuffle(self):
-        random.shuffle(self.cards)
+    def shuffle(self, rng: Optional[random.Random] = None, keep_off_top=()):
+        """Shuffle in place, using rng if given, else the global random module.
+
+        If the new top card's type is in keep_off_top, it is swapped with a
+        randomly chosen card of another type. That gives the same distribution
+        as reshuffling until the top is acceptable, in one pass.
+        """
+        rng = rng or random
+        cards = self.cards
+        rng.shuffle(cards)
+        if cards and cards[0].card_type in keep_off_top:
+            allowed = [
+                i for i, c in enumerate(cards) if c.card_type not in keep_off_top
+            ]
+            if allowed:
+                k = rng.choice(allowed)
+                cards[0], cards[k] = cards[k], cards[0]
 
     def draw(self) -> Optional[Card]:
         if self.cards:
             return self.cards.pop(0)
         return None
 
+    def draw_many(self, n: int) -> list[Card]:
+        """Draw up to n cards from the top, in draw order."""
+        drawn = self.cards[:n]
+        del self.cards[:n]
+        return drawn
+
     def peek(self) -> Optional[Card]:
         return self.cards[0] if self.cards else None
 
+    def peek_if(self, card_types) -> Optional[Card]:
+        """Return the top card only if its type is in card_types."""
+        if self.cards and self.cards[0].card_type in card_types:
+            return self.cards[0]
+        return None
+
     def place_on_top(self, card: Card):
         self.cards.insert(0, card)
 
     def place_under(self, card: Card):
         self.cards.append(card)
 
+    def place_many_under(self, cards: list[Card]):
+        """Place cards under the deck, the first one ending up highest."""
+        self.cards.extend(cards)
+
     def is_empty(self) -> bool:
         return len(self.cards) == 0
 
@@ -279,20 +386,12 @@ class Deck:
         return {
             "name": self.name,
             "size": self.size(),
-            "top_card": self.peek().to_dict() if self.peek() else None,
+            "top_card": self.peek().as_dict if self.peek() else None,
         }
 
-    def to_snapshot_dict(self) -> dict:
-        """Full serialization for undo snapshots — includes card list."""
-        return {
-            "name": self.name,
-            "size": self.size(),
-            "top_card": self.peek().to_dict() if self.peek() else None,
-            "cards": [
-                {"card_type": c.card_type.value, "card_number": c.card_number}
-                for c in self.cards
-            ],
-        }
+    def card_refs(self) -> list[list]:
+        """Compact [card_type, card_number] pairs for undo snapshots."""
+        return [[c.card_type.value, c.card_number] for c in self.cards]
 
 
 # ─── Tracks ──────────────────────────────────────────────────────────────────
@@ -315,7 +414,7 @@ RECRUIT_TRAIN_TRACK = {
 SHUFFLE_BOUNDARY = (2, 3)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackMarker:
     """A single track marker with a current position."""
 
@@ -323,7 +422,7 @@ class TrackMarker:
     position: int
     min_pos: int
     max_pos: int
-    labels: dict = field(default_factory=dict)  # position -> label string
+    labels: dict[int, str] = field(default_factory=dict)  # position -> label string
 
     def move(self, delta: int) -> tuple[int, int, bool]:
         """Move marker by delta. Returns (old_pos, new_pos, crossed_shuffle)."""
@@ -352,7 +451,7 @@ class TrackMarker:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class Tracks:
     """All track markers for The Chain."""
 
@@ -389,12 +488,34 @@ class Tracks:
     competition: CompetitionLevel = field(
         default_factory=lambda: CompetitionLevel.NEUTRAL
     )
+    # (recruit_train position, open slots, food amount) — recomputed when
+    # the marker moves
+    _recruit_train_cache: Optional[tuple[int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _recruit_train_row(self) -> tuple[int, int, int]:
+        pos = self.recruit_train.position
+        cache = self._recruit_train_cache
+        if cache is None or cache[0] != pos:
+            row = RECRUIT_TRAIN_TRACK[pos]
+            cache = (pos, row["open_slots"], row["food_amount"])
+            self._recruit_train_cache = cache
+        return cache
+
+    @property
+    def open_slots(self) -> int:
+        return self._recruit_train_row()[1]
+
+    @property
+    def food_amount(self) -> int:
+        return self._recruit_train_row()[2]
 
     def get_open_slots(self) -> int:
-        return RECRUIT_TRAIN_TRACK[self.recruit_train.position]["open_slots"]
+        return self.open_slots
 
     def get_food_amount(self) -> int:
-        return RECRUIT_TRAIN_TRACK[self.recruit_train.position]["food_amount"]
+        return self.food_amount
 
     def move_competition(self, delta: int) -> CompetitionLevel:
         """Move competition marker. Positive=toward HOT, Negative=toward COLD."""
@@ -415,8 +536,8 @@ class Tracks:
                 "level": self.competition.value,
                 "label": self.competition.label(),
             },
-            "open_slots": self.get_open_slots(),
-            "food_amount": self.get_food_amount(),
+            "open_slots": self.open_slots,
+            "food_amount": self.food_amount,
         }
 
 
@@ -436,15 +557,41 @@ class Inventory:
     At cleanup, inventory is capped to 10 per item (coffee is exempt).
     """
 
-    items: dict = field(default_factory=lambda: {item.value: 0 for item in FoodItem})
-    delta: dict = field(
+    items: dict[str, int] = field(
+        default_factory=lambda: {item.value: 0 for item in FoodItem}
+    )
+    delta: dict[str, dict[str, int]] = field(
         default_factory=lambda: {
             item.value: {"gained": 0, "lost": 0} for item in FoodItem
         }
     )
+    # Items with a count above zero, kept in step by the mutators below
+    _nonzero: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
     MAX_PER_ITEM = 20
     CLEANUP_CAP = 10
 
+    def __post_init__(self):
+        self._nonzero = {item for item, count in self.items.items() if count > 0}
+
+    def _sync_nonzero(self, item: str):
+        if self.items[item] > 0:
+            self._nonzero.add(item)
+        else:
+            self._nonzero.discard(item)
+
+    def set_count(self, item: str, count: int):
+        """Set an item's count directly (used when restoring a saved state)."""
+        if item in self.items:
+            self.items[item] = count
+            self._sync_nonzero(item)
+
+    def has_available(self, enabled_modules: frozenset[str]) -> bool:
+        """True if any core item, or item of an enabled module, is in stock."""
+        nonzero = self._nonzero
+        return not (
+            nonzero.isdisjoint(CORE_FOOD_ITEMS) and nonzero.isdisjoint(enabled_modules)
+        )
+
     def reset_delta(self):
         """Reset per-turn change tracking."""
         self.delta = {item.value: {"gained": 0, "lost": 0} for item in FoodItem}
@@ -456,15 +603,36 @@ class Inventory:
                 min(self.items[item] + amount, self.MAX_PER_ITEM) - self.items[item]
             )
             self.items[item] += actual
+            self._sync_nonzero(item)
             if item in self.delta:
                 self.delta[item]["gained"] += actual
 
+    def bulk_add(self, changes):
+        """Apply add() for each (item, amount) pair in one pass."""
+        items = self.items
+        delta = self.delta
+        nonzero = self._nonzero
+        cap = self.MAX_PER_ITEM
+        for item, amount in changes:
+            if item not in items:
+                continue
+            old = items[item]
+            new = min(old + amount, cap)
+            items[item] = new
+            if new > 0:
+                nonzero.add(item)
+            else:
+                nonzero.discard(item)
+            if item in delta:
+                delta[item]["gained"] += new - old
+
     def remove(self, item: str, amount: int) -> int:
         """Remove up to amount. Returns amount actually removed."""
         if item not in self.items:
             return 0
         removed = min(self.items[item], amount)
         self.items[item] -= removed
+        self._sync_nonzero(item)
         if item in self.delta:
             self.delta[item]["lost"] += removed
         return removed
@@ -478,14 +646,16 @@ class Inventory:
         Returns list of description strings for items that dropped.
         """
         msgs = []
-        for item, count in self.items.items():
+        if not self._nonzero:
+            return msgs
+        counts = self.items
+        delta = self.delta
+        for item, count in counts.items():
             if count >= 6:
-                old = count
-                self.items[item] = count - 5
-                dropped = old - self.items[item]
-                if item in self.delta:
-                    self.delta[item]["lost"] += dropped
-                msgs.append(f"{item}: {old}→{self.items[item]}")
+                counts[item] = new = count - 5
+                if item in delta:
+                    delta[item]["lost"] += 5
+                msgs.append(f"{item}: {count}→{new}")
         return msgs
 
     def inventory_boost(self) -> list[str]:
@@ -507,14 +677,18 @@ class Inventory:
     def cap_inventory(self) -> list[str]:
         """Enforce cleanup cap of 10 per item (excluding coffee). Returns descriptions."""
         msgs = []
-        for item_name, count in self.items.items():
-            if count > self.CLEANUP_CAP and item_name != FoodItem.COFFEE.value:
-                old = count
-                self.items[item_name] = self.CLEANUP_CAP
-                lost = old - self.CLEANUP_CAP
-                if item_name in self.delta:
-                    self.delta[item_name]["lost"] += lost
-                msgs.append(f"{item_name}: {old}→{self.CLEANUP_CAP}")
+        if not self._nonzero:
+            return msgs
+        counts = self.items
+        delta = self.delta
+        cap = self.CLEANUP_CAP
+        coffee = FoodItem.COFFEE.value
+        for item_name, count in counts.items():
+            if count > cap and item_name != coffee:
+                counts[item_name] = cap
+                if item_name in delta:
+                    delta[item_name]["lost"] += count - cap
+                msgs.append(f"{item_name}: {count}→{cap}")
         return msgs
 
     def clear_item(self, item: str):
@@ -522,9 +696,24 @@ class Inventory:
         if item in self.items:
             lost = self.items[item]
             self.items[item] = 0
+            self._nonzero.discard(item)
             if lost > 0 and item in self.delta:
                 self.delta[item]["lost"] += lost
 
+    def bulk_clear(self, items):
+        """Apply clear_item() to each item in one pass."""
+        counts = self.items
+        delta = self.delta
+        nonzero = self._nonzero
+        for item in items:
+            lost = counts.get(item)
+            if lost is None:
+                continue
+            counts[item] = 0
+            nonzero.discard(item)
+            if lost > 0 and item in delta:
+                delta[item]["lost"] += lost
+
     def to_dict(self) -> dict:
         """Serialise for API / UI. Provides row info for display."""
         result = {}
@@ -557,7 +746,7 @@ MARKETEER_DURATIONS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketeerSlot:
     slot_number: int  # 1, 2, or 3
     marketeer: Optional[str] = None
@@ -597,6 +786,9 @@ MILESTONES = [
 
 # ─── Game State ──────────────────────────────────────────────────────────────
 
+# Number of undo snapshots kept in GameState.history
+UNDO_DEPTH = 20
+
 
 @dataclass
 class GameState:
@@ -609,7 +801,7 @@ class GameState:
     language: str = "en"
 
     # Active modules/expansions (beer, lemonade, softdrink are core — not toggleable)
-    modules: dict = field(
+    modules: dict[str, bool] = field(
         default_factory=lambda: {
             "coffee": False,
             "kimchi": False,
@@ -630,7 +822,7 @@ class GameState:
     )
 
     # Optional difficulty rules
-    optional_rules: dict = field(
+    optional_rules: dict[str, bool] = field(
         default_factory=lambda: {
             "hard_choices": False,
             "expand_connections": False,
@@ -661,14 +853,15 @@ class GameState:
     # Employee pile
     employee_pile: list[str] = field(default_factory=list)
 
-    # Milestones claimed by The Chain
-    milestones_claimed: list[str] = field(default_factory=list)
+    # Milestones claimed by The Chain. Dicts with None values serve as
+    # ordered sets: O(1) membership, and the UI lists them in claim order.
+    milestones_claimed: dict[str, None] = field(default_factory=dict)
 
     # Milestones already claimed by the player (not available to The Chain)
-    milestones_unavailable: list[str] = field(default_factory=list)
+    milestones_unavailable: dict[str, None] = field(default_factory=dict)
 
-    # Milestones that triggered but need user confirmation
-    pending_milestone_checks: list[str] = field(default_factory=list)
+    # Milestones that triggered but need user confirmation (prompted in order)
+    pending_milestone_checks: deque[str] = field(default_factory=deque)
 
     # Phase to restore after milestone confirmation flow completes
     phase_before_milestone: Optional[str] = None
@@ -679,9 +872,11 @@ class GameState:
     phase_before_employee_check: Optional[str] = None
 
     # Queued competition card actions needing user interaction (demand prompts, restaurant placement)
-    pending_competition_actions: list[dict] = field(default_factory=list)
+    pending_competition_actions: deque[PendingCompetitionAction] = field(
+        default_factory=deque
+    )
     # Phase to resume after all competition actions are processed
-    phase_after_competition: Optional[str] = None
+    phase_after_competition: Optional[GamePhase] = None
 
     # Restaurants placed by The Chain
     restaurants: list[dict] = field(default_factory=list)  # [{tile, position, ...}]
@@ -702,9 +897,17 @@ class GameState:
 
     # Turn log
     action_log: list[dict] = field(default_factory=list)
+    # Entries logged since the last flush: (turn, phase, message, category)
+    _log_buffer: list[tuple] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Names of the switched-on modules; dropped by modules_changed()
+    _enabled_modules: Optional[frozenset[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    # History for undo
-    history: list[str] = field(default_factory=list)  # JSON snapshots
+    # History for undo: ring buffer of the last UNDO_DEPTH snapshot dicts
+    history: deque[dict] = field(default_factory=lambda: deque(maxlen=UNDO_DEPTH))
 
     # Player input pending
     pending_input: Optional[dict] = None  # {type, prompt, options}
@@ -744,40 +947,88 @@ class GameState:
     deck_cycles: int = 0
     total_cards_drawn: int = 0
 
-    def reshuffle_deck(self):
+    @property
+    def enabled_modules(self) -> frozenset[str]:
+        """Names of the modules switched on, cached until modules_changed()."""
+        enabled = self._enabled_modules
+        if enabled is None:
+            enabled = frozenset(k for k, v in self.modules.items() if v)
+            self._enabled_modules = enabled
+        return enabled
+
+    def modules_changed(self):
+        """Call after editing self.modules so enabled_modules is rebuilt."""
+        self._enabled_modules = None
+
+    def reshuffle_deck(self, rng: Optional[random.Random] = None, keep_off_top=()):
         """Combine discard pile back into action deck and shuffle.
-        Called when action deck runs out or on R&T track shuffle trigger."""
+        Called when action deck runs out or on R&T track shuffle trigger.
+        keep_off_top lists card types that must not end up on top."""
         if self.discard_pile.cards:
             self.action_deck.cards.extend(self.discard_pile.cards)
             self.discard_pile.cards.clear()
-        self.action_deck.shuffle()
+        self.action_deck.shuffle(rng, keep_off_top)
         self.deck_cycles += 1
         self.cards_drawn_this_cycle = 0
 
     def log(self, message: str, category: str = "info"):
-        self.action_log.append(
-            {
-                "turn": self.turn_number,
-                "phase": self.phase.value,
-                "message": message,
-                "category": category,
-            }
-        )
+        self._log_buffer.append((self.turn_number, self.phase.value, message, category))
+
+    def flush_log(self):
+        """Move buffered log entries into action_log in one batch."""
+        buf = self._log_buffer
+        if buf:
+            self.action_log.extend(
+                {"turn": turn, "phase": phase, "message": message, "category": category}
+                for turn, phase, message, category in buf
+            )
+            buf.clear()
 
     def save_snapshot(self):
-        """Save current state to history for undo."""
-        snapshot = self.to_dict()
-        # Replace lightweight deck dicts with full card-list snapshots
-        snapshot["action_deck"] = self.action_deck.to_snapshot_dict()
-        snapshot["discard_pile"] = self.discard_pile.to_snapshot_dict()
-        snapshot["warm_deck"] = self.warm_deck.to_snapshot_dict()
-        snapshot["cool_deck"] = self.cool_deck.to_snapshot_dict()
-        # Don't include history in the snapshot to avoid nesting
-        snapshot.pop("history", None)
-        self.history.append(json.dumps(snapshot))
-        # Keep last 20 snapshots
-        if len(self.history) > 20:
-            self.history = self.history[-20:]
+        """Save current state to history for undo.
+
+        Only the fields GameEngine.undo() restores are recorded, with decks
+        stored as card references rather than full card dicts. Snapshots stay
+        in memory as dicts: containers mutated in place are copied, while the
+        card and prompt dicts (always replaced, never edited) are shared.
+        """
+        snapshot = {
+            "turn_number": self.turn_number,
+            "phase": self.phase.value,
+            "bank_breaks": self.bank_breaks,
+            "current_front_card": self.current_front_card,
+            "current_back_card": self.current_back_card,
+            "current_competition_card": self.current_competition_card,
+            "pending_input": self.pending_input,
+            "is_first_turn": self.is_first_turn,
+            "chain_cash_this_turn": self.chain_cash_this_turn,
+            "chain_total_cash": self.chain_total_cash,
+            "bonus_cash_multiplier": self.bonus_cash_multiplier,
+            "no_driveins_this_turn": self.no_driveins_this_turn,
+            "milestones_claimed": self.milestones_claimed.copy(),
+            "restaurants": [r.copy() for r in self.restaurants],
+            "employee_pile": self.employee_pile.copy(),
+            "mass_marketeer": self.mass_marketeer,
+            "pending_stars": self.pending_stars.copy(),
+            "cards_drawn_this_cycle": self.cards_drawn_this_cycle,
+            "deck_cycles": self.deck_cycles,
+            "total_cards_drawn": self.total_cards_drawn,
+            "action_deck": self.action_deck.card_refs(),
+            "warm_deck": self.warm_deck.card_refs(),
+            "cool_deck": self.cool_deck.card_refs(),
+            "tracks": {
+                "recruit_train": self.tracks.recruit_train.position,
+                "price_distance": self.tracks.price_distance.position,
+                "waitresses": self.tracks.waitresses.position,
+                "competition": self.tracks.competition.value,
+            },
+            "inventory": self.inventory.items.copy(),
+            "marketeer_slots": [
+                [s.marketeer, s.is_busy] for s in self.marketeer_slots
+            ],
+        }
+        # Oldest snapshot falls off once UNDO_DEPTH is reached
+        self.history.append(snapshot)
 
     def to_dict(self) -> dict:
         return {
@@ -796,7 +1047,7 @@ class GameState:
             "marketeer_slots": [ms.to_dict() for ms in self.marketeer_slots],
             "mass_marketeer": self.mass_marketeer,
             "employee_pile": self.employee_pile,
-            "milestones_claimed": self.milestones_claimed,
+            "milestones_claimed": list(self.milestones_claimed),
             "restaurants": self.restaurants,
             "max_restaurants": self.max_restaurants,
             "current_front_card": self.current_front_card,
@@ -814,11 +1065,17 @@ class GameState:
             "chain_total_cash": self.chain_total_cash,
             "bonus_cash_multiplier": self.bonus_cash_multiplier,
             "no_driveins_this_turn": self.no_driveins_this_turn,
-            "milestones_unavailable": self.milestones_unavailable,
-            "pending_milestone_checks": self.pending_milestone_checks,
+            "milestones_unavailable": list(self.milestones_unavailable),
+            "pending_milestone_checks": list(self.pending_milestone_checks),
             "phase_before_milestone": self.phase_before_milestone,
-            "pending_competition_actions": self.pending_competition_actions,
-            "phase_after_competition": self.phase_after_competition,
+            "pending_competition_actions": [
+                a.to_dict() for a in self.pending_competition_actions
+            ],
+            "phase_after_competition": (
+                self.phase_after_competition.value
+                if self.phase_after_competition
+                else None
+            ),
             "chain_movie_star": self.chain_movie_star,
             "turn_order": self.turn_order,
             "display_phase": self.display_phase or self.phase.value,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import json
 import time
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
@@ -25,9 +26,10 @@ from .models import (
     TrackMarker,
     Inventory,
     MarketeerSlot,
+    PendingCompetitionAction,
     FoodItem,
 )
-from .cards import create_all_decks
+from .cards import card_catalog
 
 SAVES_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "saves"
@@ -119,6 +121,7 @@ def delete_save(slot_name: str) -> dict:
 
 def _serialize_full_state(state: GameState) -> dict:
     """Serialize complete game state including full deck contents."""
+    state.flush_log()
     return {
         "turn_number": state.turn_number,
         "phase": state.phase.value,
@@ -151,16 +154,20 @@ def _serialize_full_state(state: GameState) -> dict:
         ],
         "mass_marketeer": state.mass_marketeer,
         "employee_pile": state.employee_pile.copy(),
-        "milestones_claimed": state.milestones_claimed.copy(),
-        "milestones_unavailable": state.milestones_unavailable.copy(),
-        "pending_milestone_checks": state.pending_milestone_checks.copy(),
+        "milestones_claimed": list(state.milestones_claimed),
+        "milestones_unavailable": list(state.milestones_unavailable),
+        "pending_milestone_checks": list(state.pending_milestone_checks),
         "phase_before_milestone": state.phase_before_milestone,
         "pending_employee_checks": [c.copy() for c in state.pending_employee_checks],
         "phase_before_employee_check": state.phase_before_employee_check,
         "pending_competition_actions": [
-            a.copy() for a in state.pending_competition_actions
+            a.to_dict() for a in state.pending_competition_actions
         ],
-        "phase_after_competition": state.phase_after_competition,
+        "phase_after_competition": (
+            state.phase_after_competition.value
+            if state.phase_after_competition
+            else None
+        ),
         "restaurants": [r.copy() for r in state.restaurants],
         "max_restaurants": state.max_restaurants,
         "current_front_card": state.current_front_card,
@@ -195,6 +202,16 @@ def _serialize_card(card: Card) -> dict:
     }
 
 
+def _migrate_front_card(card_data: Optional[dict]) -> Optional[dict]:
+    """Migration: older saves stored a single fallback food as a bare string."""
+    if card_data and "front" in card_data:
+        for action in card_data["front"].get("actions", []):
+            fallback = action.get("fallback_food")
+            if isinstance(fallback, str):
+                action["fallback_food"] = [fallback]
+    return card_data
+
+
 def _deserialize_full_state(data: dict) -> GameState:
     """Rebuild full GameState from serialized data."""
     state = GameState()
@@ -211,13 +228,11 @@ def _deserialize_full_state(data: dict) -> GameState:
     for legacy_key in ("beer", "lemonade", "softdrink"):
         saved_modules.pop(legacy_key, None)
     state.modules = saved_modules
+    state.modules_changed()
     state.optional_rules = data.get("optional_rules", state.optional_rules)
 
     # Rebuild decks from card references
-    action_deck, warm_deck, cool_deck = create_all_decks()
-    all_cards = {}
-    for c in action_deck.cards + warm_deck.cards + cool_deck.cards:
-        all_cards[(c.card_type.value, c.card_number)] = c
+    all_cards = card_catalog()
 
     # Restore deck order
     state.action_deck = Deck(name="Action Deck")
@@ -261,11 +276,11 @@ def _deserialize_full_state(data: dict) -> GameState:
         if item in state.inventory.items:
             if isinstance(vals, dict):
                 # Migration: old format had {top, bottom}, new is single int
-                state.inventory.items[item] = vals.get(
-                    "count", vals.get("top", 0) + vals.get("bottom", 0)
+                state.inventory.set_count(
+                    item, vals.get("count", vals.get("top", 0) + vals.get("bottom", 0))
                 )
             else:
-                state.inventory.items[item] = vals
+                state.inventory.set_count(item, vals)
 
     # Restore marketeers
     slots_data = data.get("marketeer_slots", [])
@@ -280,17 +295,23 @@ def _deserialize_full_state(data: dict) -> GameState:
 
     state.mass_marketeer = data.get("mass_marketeer", False)
     state.employee_pile = data.get("employee_pile", [])
-    state.milestones_claimed = data.get("milestones_claimed", [])
-    state.milestones_unavailable = data.get("milestones_unavailable", [])
-    state.pending_milestone_checks = data.get("pending_milestone_checks", [])
+    state.milestones_claimed = dict.fromkeys(data.get("milestones_claimed", []))
+    state.milestones_unavailable = dict.fromkeys(
+        data.get("milestones_unavailable", [])
+    )
+    state.pending_milestone_checks = deque(data.get("pending_milestone_checks", []))
     state.phase_before_milestone = data.get("phase_before_milestone")
     state.pending_employee_checks = data.get("pending_employee_checks", [])
     state.phase_before_employee_check = data.get("phase_before_employee_check")
-    state.pending_competition_actions = data.get("pending_competition_actions", [])
-    state.phase_after_competition = data.get("phase_after_competition")
+    state.pending_competition_actions = deque(
+        PendingCompetitionAction.from_dict(a)
+        for a in data.get("pending_competition_actions", [])
+    )
+    resume_value = data.get("phase_after_competition")
+    state.phase_after_competition = GamePhase(resume_value) if resume_value else None
     state.restaurants = data.get("restaurants", [])
     state.max_restaurants = data.get("max_restaurants", 3)
-    state.current_front_card = data.get("current_front_card")
+    state.current_front_card = _migrate_front_card(data.get("current_front_card"))
     state.current_back_card = data.get("current_back_card")
     state.current_competition_card = data.get("current_competition_card")
     state.bank_breaks = data.get("bank_breaks", 0)